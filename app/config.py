@@ -1,12 +1,15 @@
-import json
+import math
 import os
 import re
+from collections.abc import Callable
 from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
+from typing import Annotated, TypeVar
 
 from dotenv import load_dotenv
-from pydantic import BaseModel, Field, ValidationError, field_validator, model_validator
+from pydantic import BaseModel, Field, ValidationError, model_validator
+from typing_extensions import TypedDict
 
 load_dotenv()
 
@@ -17,12 +20,21 @@ AURA_CREDENTIAL_ENV_KEYS = (
     "NEO4J_DATABASE",
 )
 
+# One `key=value` per line; blank lines, `#` comments and lines without `=` are skipped.
+KEY_VALUE_LINE_PATTERN = re.compile(
+    r"^[^\S\n]*(?P<key>[^\s#=][^=\n]*?|)[^\S\n]*=[^\S\n]*(?P<value>.*?)[^\S\n]*$",
+    re.MULTILINE,
+)
+
+NumberT = TypeVar("NumberT", int, float)
+DerivedT = TypeVar("DerivedT")
+
 
 class ConfigError(RuntimeError):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Settings:
     app_name: str
     environment: str
@@ -32,39 +44,28 @@ class Settings:
     neo4j_database: str
     slack_bot_token: str
     slack_signing_secret: str
+    # Pool size caps concurrent Neo4j sessions; the acquisition timeout (seconds) bounds how
+    # long a request waits for a free connection before failing instead of queueing.
+    neo4j_max_connection_pool_size: int = 100
+    neo4j_connection_acquisition_timeout: float = 60.0
 
 
-class SlackChannelConfig(BaseModel):
+class SlackChannelConfig(TypedDict):
     channel_name: str
     channel_id: str
 
-    @field_validator("channel_name", "channel_id")
-    @classmethod
-    def must_not_be_blank(cls, value: str) -> str:
-        if not value.strip():
-            raise ValueError("must not be empty")
-        return value.strip()
-
 
-class ProjectConfig(BaseModel):
+class ProjectConfig(TypedDict):
     project_id: str
     name: str
-    owner_user_ids: list[str] = Field(min_length=1)
+    owner_user_ids: Annotated[list[str], Field(min_length=1)]
 
-    @field_validator("project_id", "name")
-    @classmethod
-    def required_non_blank(cls, value: str) -> str:
-        if not value.strip():
-            raise ValueError("must not be empty")
-        return value.strip()
 
-    @field_validator("owner_user_ids")
-    @classmethod
-    def owner_user_ids_must_be_non_blank(cls, value: list[str]) -> list[str]:
-        cleaned = [owner.strip() for owner in value if owner.strip()]
-        if len(cleaned) != len(value):
-            raise ValueError("owner_user_ids must not contain empty values")
-        return cleaned
+def _required_non_blank(value: str, location: str) -> str:
+    stripped = value.strip()
+    if not stripped:
+        raise ValueError(f"{location} must not be empty")
+    return stripped
 
 
 class ProjectsConfig(BaseModel):
@@ -72,48 +73,80 @@ class ProjectsConfig(BaseModel):
     projects: list[ProjectConfig] = Field(min_length=2)
 
     @model_validator(mode="after")
-    def unique_project_ids(self) -> "ProjectsConfig":
-        project_ids = [project.project_id for project in self.projects]
-        if len(project_ids) != len(set(project_ids)):
+    def normalize_and_validate(self) -> "ProjectsConfig":
+        for field in ("channel_name", "channel_id"):
+            self.slack[field] = _required_non_blank(self.slack[field], f"slack.{field}")
+
+        project_ids: set[str] = set()
+        for index, project in enumerate(self.projects):
+            for field in ("project_id", "name"):
+                project[field] = _required_non_blank(project[field], f"projects.{index}.{field}")
+            cleaned = [owner.strip() for owner in project["owner_user_ids"]]
+            if not all(cleaned):
+                raise ValueError(f"projects.{index}.owner_user_ids must not contain empty values")
+            project["owner_user_ids"] = cleaned
+            project_ids.add(project["project_id"])
+
+        if len(project_ids) != len(self.projects):
             raise ValueError("projects.project_id values must be unique")
         return self
 
 
 def _parse_key_value_file(file_path: Path) -> dict[str, str]:
-    values: dict[str, str] = {}
-    for raw_line in file_path.read_text(encoding="utf-8").splitlines():
-        line = raw_line.strip()
-        if not line or line.startswith("#") or "=" not in line:
-            continue
-        key, value = line.split("=", 1)
-        values[key.strip()] = value.strip()
-    return values
+    return _parse_key_value_file_version(file_path, file_path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _parse_key_value_file_version(file_path: Path, mtime_ns: int) -> dict[str, str]:
+    return {
+        match["key"]: match["value"]
+        for match in KEY_VALUE_LINE_PATTERN.finditer(file_path.read_text(encoding="utf-8"))
+    }
 
 
 def _normalize_neo4j_uri(uri: str) -> str:
     # Aura files can occasionally contain spacing around :// after copy/paste.
-    return re.sub(r"\s+", "", uri)
+    return "".join(uri.split())
 
 
+def _find_aura_credential_files() -> list[Path]:
+    # Equivalent to sorted(Path(".").glob("Neo4j-*-Created-*.txt"), reverse=True).
+    prefix, suffix = "Neo4j-", ".txt"
+    with os.scandir(".") as entries:
+        names = [
+            entry.name
+            for entry in entries
+            if entry.name.startswith(prefix)
+            and entry.name.endswith(suffix)
+            and "-Created-" in entry.name[len(prefix) : -len(suffix)]
+            and entry.is_file()
+        ]
+    names.sort(reverse=True)
+    return [Path(name) for name in names]
+
+
+@lru_cache
 def _load_neo4j_credentials_from_file() -> None:
+    missing_keys = [key for key in AURA_CREDENTIAL_ENV_KEYS if not os.getenv(key)]
+    if not missing_keys:
+        return
+
     configured_path = os.getenv("NEO4J_CREDENTIALS_FILE", "").strip()
     candidate_paths: list[Path] = []
 
     if configured_path:
         candidate_paths.append(Path(configured_path))
     else:
-        candidate_paths.extend(sorted(Path(".").glob("Neo4j-*-Created-*.txt"), reverse=True))
+        candidate_paths.extend(_find_aura_credential_files())
 
     for candidate_path in candidate_paths:
         if not candidate_path.exists():
             continue
         values = _parse_key_value_file(candidate_path)
-        for key in AURA_CREDENTIAL_ENV_KEYS:
-            if not os.getenv(key) and values.get(key):
-                value = values[key]
-                if key == "NEO4J_URI":
-                    value = _normalize_neo4j_uri(value)
-                os.environ[key] = value
+        updates = {key: values[key] for key in missing_keys if values.get(key)}
+        if "NEO4J_URI" in updates:
+            updates["NEO4J_URI"] = _normalize_neo4j_uri(updates["NEO4J_URI"])
+        os.environ.update(updates)
         return
 
 
@@ -127,11 +160,30 @@ def _required_env(name: str) -> str:
     return value
 
 
+def get_app_name() -> str:
+    return os.getenv("APP_NAME", "dendrite-api").strip() or "dendrite-api"
+
+
+def _positive_number_env(name: str, default: NumberT, cast: Callable[[str], NumberT]) -> NumberT:
+    raw_value = os.getenv(name, "").strip()
+    if not raw_value:
+        return default
+    try:
+        value = cast(raw_value)
+    except ValueError as exc:
+        raise ConfigError(f"Environment variable {name} must be a number, got {raw_value!r}") from exc
+    if not math.isfinite(value):
+        raise ConfigError(f"Environment variable {name} must be a finite number, got {raw_value!r}")
+    if value <= 0:
+        raise ConfigError(f"Environment variable {name} must be positive, got {raw_value!r}")
+    return value
+
+
 @lru_cache
 def get_settings() -> Settings:
     try:
         return Settings(
-            app_name=os.getenv("APP_NAME", "dendrite-api").strip() or "dendrite-api",
+            app_name=get_app_name(),
             environment=os.getenv("ENVIRONMENT", "development").strip() or "development",
             neo4j_uri=_required_env("NEO4J_URI"),
             neo4j_username=_required_env("NEO4J_USERNAME"),
@@ -139,6 +191,12 @@ def get_settings() -> Settings:
             neo4j_database=_required_env("NEO4J_DATABASE"),
             slack_bot_token=_required_env("SLACK_BOT_TOKEN"),
             slack_signing_secret=_required_env("SLACK_SIGNING_SECRET"),
+            neo4j_max_connection_pool_size=_positive_number_env(
+                "NEO4J_MAX_CONNECTION_POOL_SIZE", 100, int
+            ),
+            neo4j_connection_acquisition_timeout=_positive_number_env(
+                "NEO4J_CONNECTION_ACQUISITION_TIMEOUT", 60.0, float
+            ),
         )
     except ConfigError as exc:
         raise ConfigError(f"Invalid runtime environment configuration: {exc}") from exc
@@ -147,24 +205,41 @@ def get_settings() -> Settings:
 @lru_cache
 def load_projects_config(path: str = "config/projects.json") -> ProjectsConfig:
     config_path = Path(path)
-    if not config_path.exists():
-        raise ConfigError(f"Missing required project config file: {config_path}")
-
     try:
-        raw_data = json.loads(config_path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as exc:
-        raise ConfigError(
-            f"Invalid JSON in {config_path}: line {exc.lineno}, column {exc.colno}"
-        ) from exc
+        raw_config = config_path.read_bytes()
+    except FileNotFoundError as exc:
+        raise ConfigError(f"Missing required project config file: {config_path}") from exc
 
     try:
-        return ProjectsConfig.model_validate(raw_data)
+        return ProjectsConfig.model_validate_json(raw_config)
     except ValidationError as exc:
+        json_errors = [error for error in exc.errors() if error["type"] == "json_invalid"]
+        if json_errors:
+            raise ConfigError(
+                f"Invalid JSON in {config_path}: {json_errors[0]['ctx']['error']}"
+            ) from exc
         raise ConfigError(
             f"Invalid project config in {config_path}: {exc}"
         ) from exc
 
 
+# cache_clear of every value derived from load_projects_config(), so clearing the config
+# never leaves a stale derived value behind.
+_projects_config_derived_cache_clears: list[Callable[[], None]] = []
+
+
+def cached_from_projects_config(func: Callable[[], DerivedT]) -> Callable[[], DerivedT]:
+    cached = lru_cache(maxsize=1)(func)
+    _projects_config_derived_cache_clears.append(cached.cache_clear)
+    return cached
+
+
+def clear_config_caches() -> None:
+    load_projects_config.cache_clear()
+    for cache_clear in _projects_config_derived_cache_clears:
+        cache_clear()
+
+
 def validate_runtime_config() -> None:
     get_settings()
     load_projects_config()
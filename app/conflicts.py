@@ -1,12 +1,14 @@
-import json
 import logging
 import uuid
-from datetime import datetime, timezone
+from collections.abc import Callable
 
-from neo4j import Driver
+from neo4j import AsyncDriver, AsyncResult, RoutingControl
 
-from app.config import get_settings, load_projects_config
+from app.config import cached_from_projects_config, load_projects_config
 from app.models import ProposedGraphDiff
+from app.neo4j_client import get_database_name
+from app.queries import DEPENDENCY_CYCLE_PATH_QUERY, PERSIST_CONFLICT_REPORTS_QUERY
+from app.serialization import dumps_sorted
 
 logger = logging.getLogger(__name__)
 
@@ -16,19 +18,24 @@ def _detect_constraint_conflict(proposed_diff: ProposedGraphDiff, commit: dict)
         return None
 
     prior_constraints: list[dict] = commit.get("prior_active_constraints", [])
+    if not prior_constraints:
+        return None
+
     new_value = proposed_diff.constraint.constraint_value
-    differing_prior_values = sorted(
-        {entry.get("value") for entry in prior_constraints if entry.get("value") != new_value}
-    )
-    if not differing_prior_values:
+    differing_values: set[str] = set()
+    conflicting_author_user_ids: set[str] = set()
+    for entry in prior_constraints:
+        value = entry.get("value")
+        if value == new_value:
+            continue
+        differing_values.add(value)
+        author_user_id = entry.get("author_user_id")
+        if author_user_id:
+            conflicting_author_user_ids.add(author_user_id)
+    if not differing_values:
         return None
-    prior_conflicting_author_user_ids = sorted(
-        {
-            entry.get("author_user_id")
-            for entry in prior_constraints
-            if entry.get("value") != new_value and entry.get("author_user_id")
-        }
-    )
+    differing_prior_values = sorted(differing_values)
+    prior_conflicting_author_user_ids = sorted(conflicting_author_user_ids)
 
     return {
         "conflict_type": "constraint_conflict",
@@ -41,28 +48,20 @@ def _detect_constraint_conflict(proposed_diff: ProposedGraphDiff, commit: dict)
     }
 
 
-def _detect_dependency_cycle(driver: Driver, proposed_diff: ProposedGraphDiff, commit: dict) -> dict | None:
+async def _detect_dependency_cycle(driver: AsyncDriver, proposed_diff: ProposedGraphDiff, commit: dict) -> dict | None:
     if proposed_diff.dependency is None:
         return None
 
     from_project_id = proposed_diff.dependency.from_project_id
     to_project_id = proposed_diff.dependency.to_project_id
-    query = """
-    MATCH p = shortestPath(
-      (start:Project {project_id: $start_project_id})
-      -[:DEPENDS_ON {is_active: true}*1..]->
-      (target:Project {project_id: $target_project_id})
+    record = await driver.execute_query(
+        DEPENDENCY_CYCLE_PATH_QUERY,
+        start_project_id=to_project_id,
+        target_project_id=from_project_id,
+        database_=get_database_name(),
+        routing_=RoutingControl.READ,
+        result_transformer_=AsyncResult.single,
     )
-    RETURN [node IN nodes(p) | node.project_id] AS path_ids
-    LIMIT 1
-    """
-    settings = get_settings()
-    with driver.session(database=settings.neo4j_database) as session:
-        record = session.run(
-            query,
-            start_project_id=to_project_id,
-            target_project_id=from_project_id,
-        ).single()
     if record is None:
         return None
 
@@ -79,8 +78,8 @@ def _detect_dependency_cycle(driver: Driver, proposed_diff: ProposedGraphDiff, c
     }
 
 
-def detect_conflicts_after_commit(
-    driver: Driver, proposed_diff: ProposedGraphDiff, commit: dict
+async def detect_conflicts_after_commit(
+    driver: AsyncDriver, proposed_diff: ProposedGraphDiff, commit: dict
 ) -> list[dict]:
     conflicts: list[dict] = []
 
@@ -88,56 +87,54 @@ def detect_conflicts_after_commit(
     if constraint_conflict is not None:
         conflicts.append(constraint_conflict)
 
-    dependency_cycle = _detect_dependency_cycle(driver, proposed_diff, commit)
+    dependency_cycle = await _detect_dependency_cycle(driver, proposed_diff, commit)
     if dependency_cycle is not None:
         conflicts.append(dependency_cycle)
 
     return conflicts
 
 
-def persist_conflict_reports(driver: Driver, commit_id: str, conflicts: list[dict]) -> list[str]:
+async def persist_conflict_reports(driver: AsyncDriver, commit_id: str, conflicts: list[dict]) -> list[str]:
     if not conflicts:
         return []
 
-    settings = get_settings()
-    created_report_ids: list[str] = []
-    with driver.session(database=settings.neo4j_database) as session:
-        for conflict in conflicts:
-            conflict_id = str(uuid.uuid4())
-            session.run(
-                """
-                MATCH (gc:GraphCommit {commit_id: $commit_id})
-                CREATE (cr:ConflictReport {
-                    conflict_id: $conflict_id,
-                    conflict_type: $conflict_type,
-                    details_json: $details_json,
-                    created_at: $created_at
-                })
-                CREATE (cr)-[:TRIGGERED_BY]->(gc)
-                """,
-                commit_id=commit_id,
-                conflict_id=conflict_id,
-                conflict_type=conflict["conflict_type"],
-                details_json=json.dumps(conflict, sort_keys=True),
-                created_at=datetime.now(timezone.utc).isoformat(),
-            ).consume()
-            created_report_ids.append(conflict_id)
-    return created_report_ids
-
-
-def _project_owner_ids_by_project() -> dict[str, list[str]]:
+    rows = [
+        {
+            "conflict_id": str(uuid.uuid4()),
+            "conflict_type": conflict["conflict_type"],
+            "details_json": dumps_sorted(conflict),
+        }
+        for conflict in conflicts
+    ]
+
+    await driver.execute_query(
+        PERSIST_CONFLICT_REPORTS_QUERY,
+        commit_id=commit_id,
+        rows=rows,
+        database_=get_database_name(),
+    )
+    return [row["conflict_id"] for row in rows]
+
+
+@cached_from_projects_config
+def _project_owner_ids_by_project() -> dict[str, tuple[str, ...]]:
     return {
-        project.project_id: project.owner_user_ids
+        project["project_id"]: tuple(project["owner_user_ids"])
         for project in load_projects_config().projects
     }
 
 
-def _involved_project_ids(conflict: dict) -> list[str]:
-    if conflict["conflict_type"] == "constraint_conflict":
-        return [conflict["project_id"]]
-    if conflict["conflict_type"] == "dependency_cycle":
-        return [conflict["from_project_id"], conflict["to_project_id"]]
-    return []
+_INVOLVED_PROJECT_IDS_BY_CONFLICT_TYPE: dict[str, Callable[[dict], tuple[str, ...]]] = {
+    "constraint_conflict": lambda conflict: (conflict["project_id"],),
+    "dependency_cycle": lambda conflict: (conflict["from_project_id"], conflict["to_project_id"]),
+}
+
+
+def _involved_project_ids(conflict: dict) -> tuple[str, ...]:
+    involved = _INVOLVED_PROJECT_IDS_BY_CONFLICT_TYPE.get(conflict["conflict_type"])
+    if involved is None:
+        return ()
+    return involved(conflict)
 
 
 def build_conflict_notification_payload(
@@ -148,7 +145,7 @@ def build_conflict_notification_payload(
 
     for conflict in conflicts:
         for project_id in _involved_project_ids(conflict):
-            recipients.update(owners_by_project.get(project_id, []))
+            recipients.update(owners_by_project.get(project_id, ()))
         for prior_author in conflict.get("prior_conflicting_author_user_ids", []):
             recipients.add(prior_author)
 
@@ -163,4 +160,7 @@ def build_conflict_notification_payload(
 
 
 def log_conflict_notification_stub(payload: dict) -> None:
-    logger.warning("conflict_notification_stub %s", json.dumps(payload, sort_keys=True))
+    # The payload is serialized eagerly, so skip it when the record would be dropped.
+    if not logger.isEnabledFor(logging.WARNING):
+        return
+    logger.warning("conflict_notification_stub %s", dumps_sorted(payload))
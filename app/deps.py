@@ -0,0 +1,9 @@
+from fastapi import HTTPException, Request
+from neo4j import AsyncDriver
+
+
+def get_neo4j_driver(request: Request) -> AsyncDriver:
+    driver = getattr(request.app.state, "neo4j_driver", None)
+    if driver is None:
+        raise HTTPException(status_code=503, detail="Neo4j driver is not initialized")
+    return driver
@@ -1,16 +1,17 @@
 from fastapi import FastAPI, Request
 
-from app.config import get_settings, validate_runtime_config
+from app.config import get_app_name, get_settings, validate_runtime_config
 from app.neo4j_client import (
     check_database_health,
     get_driver,
     run_critical_schema_migrations,
+    run_data_migrations,
     verify_driver_connectivity,
 )
 from app.routes import bootstrap, read, slack
+from app.service import close_slack_http_client
 
-settings = get_settings()
-app = FastAPI(title=settings.app_name)
+app = FastAPI(title=get_app_name())
 
 app.include_router(slack.router, prefix="/slack", tags=["slack"])
 app.include_router(read.router, prefix="/read", tags=["read"])
@@ -18,23 +19,26 @@ app.include_router(bootstrap.router, prefix="/bootstrap", tags=["bootstrap"])
 
 
 @app.on_event("startup")
-def startup() -> None:
+async def startup() -> None:
     validate_runtime_config()
     driver = get_driver()
-    verify_driver_connectivity(driver)
-    run_critical_schema_migrations(driver)
+    await verify_driver_connectivity(driver)
+    await run_critical_schema_migrations(driver)
+    await run_data_migrations(driver)
     app.state.neo4j_driver = driver
 
 
 @app.on_event("shutdown")
-def shutdown() -> None:
+async def shutdown() -> None:
     driver = getattr(app.state, "neo4j_driver", None)
     if driver is not None:
-        driver.close()
+        await driver.close()
+    await close_slack_http_client()
 
 
 @app.get("/health", tags=["health"])
-def health(request: Request) -> dict:
+async def health(request: Request) -> dict:
+    settings = get_settings()
     driver = getattr(request.app.state, "neo4j_driver", None)
     if driver is None:
         return {
@@ -42,7 +46,7 @@ def health(request: Request) -> dict:
             "database": {"status": "not_initialized", "database": settings.neo4j_database},
         }
 
-    db_ok, detail = check_database_health(driver)
+    db_ok, detail = await check_database_health(driver)
     return {
         "app": {"status": "ok"},
         "database": {
@@ -1,14 +1,59 @@
 CRITICAL_SCHEMA_STATEMENTS: tuple[str, ...] = (
     "CREATE CONSTRAINT project_project_id_unique IF NOT EXISTS "
     "FOR (p:Project) REQUIRE p.project_id IS UNIQUE",
+    # A lookup index rather than a uniqueness constraint: creating the constraint fails,
+    # and with it startup, on databases that already hold duplicate Person.user_id nodes.
+    # The index still serves bootstrap's MERGE on user_id and the project owner lookups.
+    "CREATE INDEX person_user_id IF NOT EXISTS "
+    "FOR (u:Person) ON (u.user_id)",
     "CREATE CONSTRAINT slack_message_message_id_unique IF NOT EXISTS "
     "FOR (m:SlackMessage) REQUIRE m.message_id IS UNIQUE",
     "CREATE CONSTRAINT slack_message_event_id_unique IF NOT EXISTS "
     "FOR (m:SlackMessage) REQUIRE m.event_id IS UNIQUE",
+    "CREATE CONSTRAINT graph_head_head_id_unique IF NOT EXISTS "
+    "FOR (h:GraphHead) REQUIRE h.head_id IS UNIQUE",
     "CREATE CONSTRAINT graph_commit_commit_id_unique IF NOT EXISTS "
     "FOR (gc:GraphCommit) REQUIRE gc.commit_id IS UNIQUE",
     "CREATE CONSTRAINT graph_commit_sequence_number_unique IF NOT EXISTS "
     "FOR (gc:GraphCommit) REQUIRE gc.sequence_number IS UNIQUE",
     "CREATE INDEX constraint_project_key_active IF NOT EXISTS "
     "FOR (c:Constraint) ON (c.project_id, c.key, c.is_active)",
+    "CREATE INDEX graph_commit_timestamp IF NOT EXISTS "
+    "FOR (gc:GraphCommit) ON (gc.timestamp)",
 )
+
+# Creates the GraphHead pointer once, seeded from the newest existing commit so databases
+# created before the head node existed continue their sequence instead of restarting at 1.
+GRAPH_HEAD_SEED_STATEMENT = """
+OPTIONAL MATCH (gc:GraphCommit)
+WITH gc
+ORDER BY gc.sequence_number DESC
+LIMIT 1
+MERGE (h:GraphHead {head_id: 'main'})
+  ON CREATE SET
+    h.last_sequence_number = coalesce(gc.sequence_number, 0),
+    h.last_commit_id = gc.commit_id
+"""
+
+# Commits written before timestamps became native datetimes stored isoformat() strings;
+# a string never compares to a datetime, so convert them once to keep them queryable.
+# One-off data migration, not part of the critical schema: it is recorded under
+# GRAPH_COMMIT_TIMESTAMP_BACKFILL_ID once it succeeds and skipped on later boots.
+# toString() is the identity only on strings (a datetime never equals its string form),
+# which keeps the predicate valid on every Neo4j 5 release, unlike `IS :: STRING` (5.9+).
+GRAPH_COMMIT_TIMESTAMP_BACKFILL_ID = "graph_commit_timestamp_datetime"
+GRAPH_COMMIT_TIMESTAMP_BACKFILL_STATEMENT = """
+MATCH (gc:GraphCommit)
+WHERE toString(gc.timestamp) = gc.timestamp
+SET gc.timestamp = datetime(gc.timestamp)
+"""
+
+DATA_MIGRATION_APPLIED_QUERY = """
+MATCH (m:DataMigration {migration_id: $migration_id})
+RETURN count(m) > 0 AS applied
+"""
+
+RECORD_DATA_MIGRATION_STATEMENT = """
+MERGE (m:DataMigration {migration_id: $migration_id})
+  ON CREATE SET m.applied_at = datetime()
+"""
@@ -49,6 +49,11 @@ class ProposedGraphDiff(BaseModel):
         return self
 
 
+# ParsedMessage refers to ProposedGraphDiff before it exists; build its validator now
+# instead of on the first Slack event.
+ParsedMessage.model_rebuild()
+
+
 class BootstrapResponse(BaseModel):
     ok: bool
     detail: str
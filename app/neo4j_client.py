@@ -1,34 +1,71 @@
-from neo4j import Driver, GraphDatabase
+from functools import lru_cache
+
+from neo4j import AsyncDriver, AsyncGraphDatabase
 from neo4j.exceptions import Neo4jError
 
 from app.config import get_settings
-from app.migrations import CRITICAL_SCHEMA_STATEMENTS
+from app.migrations import (
+    CRITICAL_SCHEMA_STATEMENTS,
+    DATA_MIGRATION_APPLIED_QUERY,
+    GRAPH_COMMIT_TIMESTAMP_BACKFILL_ID,
+    GRAPH_COMMIT_TIMESTAMP_BACKFILL_STATEMENT,
+    GRAPH_HEAD_SEED_STATEMENT,
+    RECORD_DATA_MIGRATION_STATEMENT,
+)
 
 
-def get_driver() -> Driver:
+def get_driver() -> AsyncDriver:
     settings = get_settings()
-    return GraphDatabase.driver(
+    return AsyncGraphDatabase.driver(
         settings.neo4j_uri,
         auth=(settings.neo4j_username, settings.neo4j_password),
+        max_connection_pool_size=settings.neo4j_max_connection_pool_size,
+        connection_acquisition_timeout=settings.neo4j_connection_acquisition_timeout,
+        max_connection_lifetime=3600,
+        keep_alive=True,
     )
 
 
-def verify_driver_connectivity(driver: Driver) -> None:
-    driver.verify_connectivity()
+@lru_cache
+def get_database_name() -> str:
+    return get_settings().neo4j_database
 
 
-def check_database_health(driver: Driver) -> tuple[bool, str]:
-    settings = get_settings()
+async def verify_driver_connectivity(driver: AsyncDriver) -> None:
+    await driver.verify_connectivity()
+
+
+async def check_database_health(driver: AsyncDriver) -> tuple[bool, str]:
     try:
-        with driver.session(database=settings.neo4j_database) as session:
-            session.run("RETURN 1 AS ok").single()
+        async with driver.session(database=get_database_name()) as session:
+            result = await session.run("RETURN 1 AS ok")
+            await result.single()
         return True, "ok"
     except (Neo4jError, OSError, RuntimeError) as exc:
         return False, str(exc)
 
 
-def run_critical_schema_migrations(driver: Driver) -> None:
-    settings = get_settings()
-    with driver.session(database=settings.neo4j_database) as session:
-        for statement in CRITICAL_SCHEMA_STATEMENTS:
-            session.run(statement).consume()
+async def run_critical_schema_migrations(driver: AsyncDriver) -> None:
+    async with driver.session(database=get_database_name()) as session:
+        for statement in (*CRITICAL_SCHEMA_STATEMENTS, GRAPH_HEAD_SEED_STATEMENT):
+            result = await session.run(statement)
+            await result.consume()
+
+
+async def run_data_migrations(driver: AsyncDriver) -> None:
+    # Not skippable on failure: until the backfill has run, string timestamps drop out of
+    # the since-filtered reads without an error, so a failure aborts startup like the
+    # schema statements do. Once recorded it is a single lookup per boot.
+    async with driver.session(database=get_database_name()) as session:
+        result = await session.run(
+            DATA_MIGRATION_APPLIED_QUERY, migration_id=GRAPH_COMMIT_TIMESTAMP_BACKFILL_ID
+        )
+        record = await result.single()
+        if record["applied"]:
+            return
+        result = await session.run(GRAPH_COMMIT_TIMESTAMP_BACKFILL_STATEMENT)
+        await result.consume()
+        result = await session.run(
+            RECORD_DATA_MIGRATION_STATEMENT, migration_id=GRAPH_COMMIT_TIMESTAMP_BACKFILL_ID
+        )
+        await result.consume()
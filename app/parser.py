@@ -21,6 +21,7 @@ DEPENDENCY_UPDATE_PATTERN = re.compile(
     r"why:\s*(?P<reason>.+?)\s*$",
     re.IGNORECASE,
 )
+HASHTAG_TOKEN_PATTERN = re.compile(r"(?<!\S)#\S*")
 
 
 def parse_constraint_update(
@@ -96,6 +97,6 @@ def parse_dependency_update(
 
 
 def parse_event(event: SlackEvent) -> ParsedMessage:
-    entities = [token for token in event.text.split() if token.startswith("#")]
+    entities = HASHTAG_TOKEN_PATTERN.findall(event.text) if "#" in event.text else []
     summary = event.text[:120].strip()
     return ParsedMessage(summary=summary, entities=entities)
@@ -0,0 +1,280 @@
+from typing import Final
+
+# Cypher sent by the service layer. Values are always passed as $parameters: the server
+# caches plans by query text, so formatting anything into these strings defeats the cache.
+
+# No-change write that takes the head's write lock before anything is read, so the no-op
+# check in the same transaction cannot race a concurrent commit from another process.
+LOCK_GRAPH_HEAD_QUERY: Final = """
+MATCH (h:GraphHead {head_id: 'main'})
+SET h.last_sequence_number = h.last_sequence_number
+"""
+
+# Incrementing first takes the head's write lock, so concurrent commits queue on it and
+# each sees the sequence number and parent left by the previous one.
+ADVANCE_GRAPH_HEAD_QUERY: Final = """
+MATCH (h:GraphHead {head_id: 'main'})
+SET h.last_sequence_number = h.last_sequence_number + 1
+WITH h, h.last_sequence_number AS sequence_number, h.last_commit_id AS parent_commit_id
+SET h.last_commit_id = $commit_id
+RETURN sequence_number, parent_commit_id
+"""
+
+# Shared head of the per-update-type commit queries: creates the GraphCommit with a
+# server-assigned timestamp and links it to its Slack message when one was persisted.
+_CREATE_GRAPH_COMMIT_CLAUSES = """
+CREATE (gc:GraphCommit {
+    commit_id: $commit_id,
+    sequence_number: $sequence_number,
+    parent_commit_id: $parent_commit_id,
+    actor_user_id: $actor_user_id,
+    timestamp: datetime.transaction(),
+    source: $source,
+    diff_json: $diff_json,
+    why: $why,
+    commit_message: $commit_message
+})
+WITH gc, toString(gc.timestamp) AS committed_at
+OPTIONAL MATCH (m:SlackMessage {message_id: $source_message_id})
+FOREACH (_ IN CASE WHEN m IS NULL THEN [] ELSE [1] END |
+    MERGE (gc)-[:FROM_MESSAGE]->(m)
+)
+WITH gc, committed_at
+"""
+
+# A missing project yields no row; the caller raises and the transaction rolls back.
+COMMIT_CONSTRAINT_UPSERT_QUERY: Final = _CREATE_GRAPH_COMMIT_CLAUSES + """
+MATCH (p:Project {project_id: $project_id})
+OPTIONAL MATCH (p)-[:HAS_CONSTRAINT]->(prior:Constraint {
+    key: $constraint_key,
+    is_active: true
+})
+WITH gc, committed_at, p, collect(prior) AS prior_constraints
+WITH gc, committed_at, p,
+     [c IN prior_constraints WHERE c IS NOT NULL | {
+         value: c.value,
+         author_user_id: c.author_user_id
+     }] AS prior_constraints_data,
+     prior_constraints
+FOREACH (c IN prior_constraints |
+    SET c.is_active = false, c.deactivated_at = committed_at
+)
+CREATE (new_constraint:Constraint {
+    constraint_id: $constraint_id,
+    project_id: $project_id,
+    key: $constraint_key,
+    value: $constraint_value,
+    type: $constraint_type,
+    reason: $constraint_reason,
+    is_active: true,
+    source_message_id: $source_message_id,
+    source_permalink: $source_permalink,
+    author_user_id: $actor_user_id,
+    created_at: committed_at
+})
+CREATE (p)-[:HAS_CONSTRAINT]->(new_constraint)
+CREATE (new_constraint)-[:INTRODUCED_BY]->(gc)
+MERGE (gc)-[:APPLIES_TO]->(p)
+SET p.updated_at = committed_at
+RETURN committed_at AS timestamp, p.project_id AS project_id, prior_constraints_data AS prior_constraints_data
+"""
+
+COMMIT_DEPENDENCY_ADD_QUERY: Final = _CREATE_GRAPH_COMMIT_CLAUSES + """
+MATCH (from_p:Project {project_id: $from_project_id})
+MATCH (to_p:Project {project_id: $to_project_id})
+CREATE (from_p)-[:DEPENDS_ON {
+    dependency_id: $dependency_id,
+    reason: $dependency_reason,
+    is_active: true,
+    source_message_id: $source_message_id,
+    source_permalink: $source_permalink,
+    author_user_id: $actor_user_id,
+    created_at: committed_at
+}]->(to_p)
+MERGE (gc)-[:APPLIES_TO]->(from_p)
+MERGE (gc)-[:APPLIES_TO]->(to_p)
+SET from_p.updated_at = committed_at,
+    to_p.updated_at = committed_at
+RETURN committed_at AS timestamp, from_p.project_id AS from_project_id, to_p.project_id AS to_project_id
+"""
+
+NO_OP_CHECK_QUERY: Final = """
+RETURN
+  EXISTS {
+    MATCH (:Constraint {
+      project_id: $project_id,
+      key: $constraint_key,
+      value: $constraint_value,
+      is_active: true
+    })
+  } AS constraint_no_op,
+  EXISTS {
+    MATCH (:Project {project_id: $from_project_id})
+      -[:DEPENDS_ON {is_active: true}]->
+      (:Project {project_id: $to_project_id})
+  } AS dependency_no_op
+"""
+
+ACTIVE_CONSTRAINTS_QUERY: Final = """
+MATCH (p:Project)-[:HAS_CONSTRAINT]->(c:Constraint {is_active: true})
+RETURN
+  p.project_id AS project_id,
+  c.constraint_id AS constraint_id,
+  c.key AS constraint_key,
+  c.value AS constraint_value,
+  c.type AS constraint_type,
+  c.reason AS reason,
+  c.source_permalink AS source_permalink,
+  c.author_user_id AS author_user_id,
+  c.created_at AS created_at
+ORDER BY p.project_id, c.key
+"""
+
+ACTIVE_DEPENDENCIES_QUERY: Final = """
+MATCH (from_p:Project)-[d:DEPENDS_ON {is_active: true}]->(to_p:Project)
+RETURN
+  d.dependency_id AS dependency_id,
+  from_p.project_id AS from_project_id,
+  to_p.project_id AS to_project_id,
+  d.reason AS reason,
+  d.source_permalink AS source_permalink,
+  d.author_user_id AS author_user_id,
+  d.created_at AS created_at
+ORDER BY from_p.project_id, to_p.project_id
+"""
+
+GRAPH_CHANGES_SINCE_QUERY: Final = """
+MATCH (gc:GraphCommit)
+WHERE gc.timestamp >= $since
+RETURN
+  gc.commit_id AS commit_id,
+  gc.sequence_number AS sequence_number,
+  gc.parent_commit_id AS parent_commit_id,
+  gc.actor_user_id AS actor_user_id,
+  toString(gc.timestamp) AS timestamp,
+  gc.source AS source,
+  gc.diff_json AS diff_json,
+  gc.why AS why,
+  gc.commit_message AS commit_message
+ORDER BY gc.sequence_number ASC
+"""
+
+PROJECT_BY_ID_QUERY: Final = """
+MATCH (p:Project {project_id: $project_id})
+OPTIONAL MATCH (owner:Person)-[:OWNS]->(p)
+RETURN
+  p.project_id AS project_id,
+  p.name AS name,
+  p.created_at AS created_at,
+  p.updated_at AS updated_at,
+  [user_id IN collect(DISTINCT owner.user_id) WHERE user_id IS NOT NULL] AS owner_user_ids
+LIMIT 1
+"""
+
+PROJECT_EXISTS_QUERY: Final = """
+MATCH (p:Project {project_id: $project_id})
+RETURN p.project_id AS project_id
+LIMIT 1
+"""
+
+PROJECT_ACTIVE_CONSTRAINTS_QUERY: Final = """
+MATCH (p:Project {project_id: $project_id})-[:HAS_CONSTRAINT]->(c:Constraint {is_active: true})
+RETURN
+  c.constraint_id AS constraint_id,
+  c.key AS constraint_key,
+  c.value AS constraint_value,
+  c.type AS constraint_type,
+  c.reason AS reason,
+  c.source_permalink AS source_permalink,
+  c.author_user_id AS author_user_id,
+  c.created_at AS created_at
+ORDER BY c.type, c.key
+"""
+
+PROJECT_ACTIVE_DEPENDENCIES_QUERY: Final = """
+MATCH (from_p:Project {project_id: $project_id})
+  -[d:DEPENDS_ON {is_active: true}]->
+  (to_p:Project)
+RETURN
+  d.dependency_id AS dependency_id,
+  from_p.project_id AS from_project_id,
+  to_p.project_id AS to_project_id,
+  d.reason AS reason,
+  d.source_permalink AS source_permalink,
+  d.author_user_id AS author_user_id,
+  d.created_at AS created_at
+ORDER BY to_p.project_id
+"""
+
+# Records the message and reports whether it had already been processed in one round trip.
+# A redelivery of a processed message only has its status rewritten to no_op_duplicate.
+PERSIST_SLACK_MESSAGE_QUERY: Final = """
+MERGE (m:SlackMessage {message_id: $message_id})
+  ON CREATE SET m.created_at = datetime().epochMillis
+WITH m, coalesce(m.ingestion_status IN ['processed', 'no_op_duplicate'], false) AS already_processed
+SET m += CASE WHEN already_processed
+  THEN {ingestion_status: 'no_op_duplicate', error_reason: 'message_already_processed'}
+  ELSE {
+    event_id: $event_id,
+    timestamp: $ts,
+    channel_id: $channel_id,
+    user_id: $user_id,
+    raw_text: $raw_text,
+    permalink: $permalink,
+    ingestion_status: $ingestion_status,
+    error_reason: $error_reason
+  }
+END
+RETURN already_processed
+"""
+
+UPDATE_SLACK_MESSAGE_STATUS_QUERY: Final = """
+MATCH (m:SlackMessage {message_id: $message_id})
+SET m.ingestion_status = $ingestion_status,
+    m.error_reason = $error_reason
+"""
+
+# CALL ... IN TRANSACTIONS only runs in auto-commit transactions, i.e. session.run.
+BOOTSTRAP_PROJECTS_QUERY: Final = """
+UNWIND $projects AS project
+CALL {
+  WITH project
+  MERGE (p:Project {project_id: project.project_id})
+    ON CREATE SET p.created_at = datetime().epochMillis
+  SET p.name = project.name, p.updated_at = datetime().epochMillis
+} IN TRANSACTIONS OF $batch_size ROWS
+"""
+
+BOOTSTRAP_OWNER_LINKS_QUERY: Final = """
+UNWIND $owner_links AS link
+CALL {
+  WITH link
+  MATCH (p:Project {project_id: link.project_id})
+  MERGE (person:Person {user_id: link.owner_user_id})
+  MERGE (person)-[:OWNS]->(p)
+  RETURN 1 AS linked
+} IN TRANSACTIONS OF $batch_size ROWS
+RETURN count(linked) AS owner_link_count
+"""
+
+DEPENDENCY_CYCLE_PATH_QUERY: Final = """
+MATCH p = shortestPath(
+  (start:Project {project_id: $start_project_id})
+  -[:DEPENDS_ON {is_active: true}*1..]->
+  (target:Project {project_id: $target_project_id})
+)
+RETURN [node IN nodes(p) | node.project_id] AS path_ids
+LIMIT 1
+"""
+
+PERSIST_CONFLICT_REPORTS_QUERY: Final = """
+MATCH (gc:GraphCommit {commit_id: $commit_id})
+UNWIND $rows AS row
+CREATE (cr:ConflictReport {
+    conflict_id: row.conflict_id,
+    conflict_type: row.conflict_type,
+    details_json: row.details_json,
+    created_at: datetime.transaction()
+})
+CREATE (cr)-[:TRIGGERED_BY]->(gc)
+"""
@@ -1,5 +1,7 @@
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, Depends
+from neo4j import AsyncDriver
 
+from app.deps import get_neo4j_driver
 from app.models import BootstrapResponse
 from app.service import bootstrap_from_config
 
@@ -7,8 +9,5 @@ router = APIRouter()
 
 
 @router.post("")
-def bootstrap(request: Request) -> BootstrapResponse:
-    driver = getattr(request.app.state, "neo4j_driver", None)
-    if driver is None:
-        raise HTTPException(status_code=503, detail="Neo4j driver is not initialized")
-    return bootstrap_from_config(driver)
+async def bootstrap(driver: AsyncDriver = Depends(get_neo4j_driver)) -> BootstrapResponse:
+    return await bootstrap_from_config(driver)
@@ -1,63 +1,132 @@
-from datetime import datetime
+import logging
+import re
+from collections.abc import AsyncIterator
+from datetime import datetime, timezone
+from functools import lru_cache
 
-from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import JSONResponse, StreamingResponse
+from neo4j import AsyncDriver
+from neo4j.exceptions import DriverError, Neo4jError
 
+from app.deps import get_neo4j_driver
+from app.serialization import dumps_line
 from app.service import (
     get_graph_changes_since,
     get_graph_current_truth,
     get_project_by_id,
     get_project_checklist,
+    stream_graph_changes_since,
+    stream_graph_current_truth,
 )
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
+# Loose shape check only: everything datetime.fromisoformat accepts starts with a
+# four-digit year and is short, so obvious garbage is rejected without a parse attempt.
+ISO_8601_PREFIX_PATTERN = re.compile(r"\d{4}")
+MAX_SINCE_LENGTH = 64
 
-@router.get("/status")
-def read_status() -> dict[str, str]:
-    return {"message": "read route online"}
+INVALID_SINCE_DETAIL = "Invalid 'since' parameter. Use ISO-8601 format."
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+STREAM_ERROR_LINE = dumps_line({"kind": "error", "detail": "stream_interrupted"})
 
+# Rendered once at import; the response holds no per-request state, so it is safe to reuse.
+STATUS_RESPONSE = JSONResponse({"message": "read route online"})
 
-@router.get("/graph/current")
-def read_graph_current(request: Request) -> dict:
-    driver = getattr(request.app.state, "neo4j_driver", None)
-    if driver is None:
-        raise HTTPException(status_code=503, detail="Neo4j driver is not initialized")
-    return get_graph_current_truth(driver)
 
+@lru_cache(maxsize=1024)
+def _normalize_since(since: str) -> datetime:
+    # Raises ValueError for invalid input; lru_cache does not cache exceptions. Naive input
+    # means UTC. datetimes are immutable, so sharing cached instances is safe.
+    parsed = datetime.fromisoformat(since.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
 
-@router.get("/graph/changes")
-def read_graph_changes(request: Request, since: str = Query(...)) -> dict:
+
+def _validated_since(since: str) -> datetime:
+    if len(since) > MAX_SINCE_LENGTH or not ISO_8601_PREFIX_PATTERN.match(since):
+        raise HTTPException(status_code=400, detail=INVALID_SINCE_DETAIL)
     try:
-        normalized_since = datetime.fromisoformat(since.replace("Z", "+00:00")).isoformat()
+        return _normalize_since(since)
     except ValueError as exc:
-        raise HTTPException(
-            status_code=400,
-            detail="Invalid 'since' parameter. Use ISO-8601 format.",
-        ) from exc
+        raise HTTPException(status_code=400, detail=INVALID_SINCE_DETAIL) from exc
+
+
+async def _ndjson(rows: AsyncIterator[dict]) -> AsyncIterator[bytes]:
+    # The 200 status is sent before the first row, so a failure mid-stream cannot change
+    # it; a final error line tells the client the body is truncated rather than complete.
+    try:
+        async for row in rows:
+            yield dumps_line(row)
+    except (Neo4jError, DriverError):
+        logger.exception("ndjson_stream_failed")
+        yield STREAM_ERROR_LINE
+
+
+@router.get("/status", response_model=dict[str, str])
+async def read_status() -> JSONResponse:
+    return STATUS_RESPONSE
+
+
+@router.get("/graph/current")
+async def read_graph_current(driver: AsyncDriver = Depends(get_neo4j_driver)) -> dict:
+    return await get_graph_current_truth(driver)
+
+
+@router.get("/graph/current/stream")
+async def stream_graph_current(
+    driver: AsyncDriver = Depends(get_neo4j_driver),
+) -> StreamingResponse:
+    """Stream active constraints, then dependencies, as NDJSON rows tagged by kind.
+
+    The two reads run one after the other and are not a single snapshot: a commit landing
+    between them can be reflected in the dependencies but not the constraints. A failure
+    mid-stream ends the body with a {"kind": "error"} line.
+    """
+    return StreamingResponse(
+        _ndjson(stream_graph_current_truth(driver)), media_type=NDJSON_MEDIA_TYPE
+    )
+
+
+@router.get("/graph/changes")
+async def read_graph_changes(
+    since: str = Query(...), driver: AsyncDriver = Depends(get_neo4j_driver)
+) -> dict:
+    return await get_graph_changes_since(driver, _validated_since(since))
+
+
+@router.get("/graph/changes/stream")
+async def stream_graph_changes(
+    since: str = Query(...), driver: AsyncDriver = Depends(get_neo4j_driver)
+) -> StreamingResponse:
+    """Stream graph commits since the given time as NDJSON rows.
 
-    driver = getattr(request.app.state, "neo4j_driver", None)
-    if driver is None:
-        raise HTTPException(status_code=503, detail="Neo4j driver is not initialized")
-    return get_graph_changes_since(driver, normalized_since)
+    Rows are pulled from the server as the client consumes them. A failure
+    mid-stream ends the body with a {"kind": "error"} line.
+    """
+    return StreamingResponse(
+        _ndjson(stream_graph_changes_since(driver, _validated_since(since))),
+        media_type=NDJSON_MEDIA_TYPE,
+    )
 
 
 @router.get("/projects/{project_id}")
-def read_project(request: Request, project_id: str) -> dict:
-    driver = getattr(request.app.state, "neo4j_driver", None)
-    if driver is None:
-        raise HTTPException(status_code=503, detail="Neo4j driver is not initialized")
-    project = get_project_by_id(driver, project_id)
+async def read_project(project_id: str, driver: AsyncDriver = Depends(get_neo4j_driver)) -> dict:
+    project = await get_project_by_id(driver, project_id)
     if project is None:
         raise HTTPException(status_code=404, detail="Project not found")
     return project
 
 
 @router.get("/projects/{project_id}/checklist")
-def read_project_checklist(request: Request, project_id: str) -> dict:
-    driver = getattr(request.app.state, "neo4j_driver", None)
-    if driver is None:
-        raise HTTPException(status_code=503, detail="Neo4j driver is not initialized")
-    checklist = get_project_checklist(driver, project_id)
+async def read_project_checklist(
+    project_id: str, driver: AsyncDriver = Depends(get_neo4j_driver)
+) -> dict:
+    checklist = await get_project_checklist(driver, project_id)
     if checklist is None:
         raise HTTPException(status_code=404, detail="Project not found")
     return checklist
@@ -1,8 +1,10 @@
 import hashlib
 import hmac
 import time
+from functools import lru_cache
 
 from fastapi import APIRouter, HTTPException, Request, status
+from neo4j import AsyncDriver
 
 from app.config import get_settings
 from app.conflicts import (
@@ -11,22 +13,26 @@ from app.conflicts import (
     log_conflict_notification_stub,
     persist_conflict_reports,
 )
-from app.models import SlackEvent
+from app.deps import get_neo4j_driver
+from app.serialization import loads
 from app.service import (
-    COMMIT_APPLY_LOCK,
+    commit_apply_lock,
     create_graph_commit,
-    find_unknown_project_ids,
-    get_configured_project_ids,
-    is_constraint_no_op,
-    is_dependency_no_op,
     preprocess_slack_event,
-    process_slack_event,
+    request_session,
     send_thread_feedback_stub,
     update_slack_message_status,
 )
 
 router = APIRouter()
 MAX_SLACK_TIMESTAMP_AGE_SECONDS = 60 * 5
+SLACK_SIGNATURE_PREFIX = "v0="
+SLACK_SIGNATURE_LENGTH = len(SLACK_SIGNATURE_PREFIX) + 2 * hashlib.sha256().digest_size
+
+
+@lru_cache
+def _signing_key() -> bytes:
+    return get_settings().slack_signing_secret.encode("utf-8")
 
 
 def _verify_slack_signature(raw_body: bytes, timestamp: str, signature: str) -> None:
@@ -50,19 +56,21 @@ def _verify_slack_signature(raw_body: bytes, timestamp: str, signature: str) ->
             detail="Slack request timestamp is too old",
         )
 
-    settings = get_settings()
-    base_string = f"v0:{timestamp}:{raw_body.decode('utf-8')}"
-    expected_signature = "v0=" + hmac.new(
-        settings.slack_signing_secret.encode("utf-8"),
-        base_string.encode("utf-8"),
-        hashlib.sha256,
-    ).hexdigest()
+    invalid_signature = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Invalid Slack request signature",
+    )
+    if len(signature) != SLACK_SIGNATURE_LENGTH or not signature.startswith(SLACK_SIGNATURE_PREFIX):
+        raise invalid_signature
+    try:
+        provided_digest = bytes.fromhex(signature[len(SLACK_SIGNATURE_PREFIX) :])
+    except ValueError as exc:
+        raise invalid_signature from exc
 
-    if not hmac.compare_digest(expected_signature, signature):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid Slack request signature",
-        )
+    base_string = b"v0:" + timestamp.encode("utf-8") + b":" + raw_body
+    expected_digest = hmac.new(_signing_key(), base_string, hashlib.sha256).digest()
+    if not hmac.compare_digest(expected_digest, provided_digest):
+        raise invalid_signature
 
 
 @router.post("/events")
@@ -72,7 +80,7 @@ async def ingest_slack_event(request: Request) -> dict:
     timestamp = request.headers.get("X-Slack-Request-Timestamp", "")
     _verify_slack_signature(raw_body=raw_body, timestamp=timestamp, signature=signature)
 
-    payload = await request.json()
+    payload = loads(raw_body)
 
     if payload.get("type") == "url_verification":
         challenge = payload.get("challenge")
@@ -83,103 +91,42 @@ async def ingest_slack_event(request: Request) -> dict:
             )
         return {"challenge": challenge}
 
-    driver = getattr(request.app.state, "neo4j_driver", None)
-    if driver is None:
-        raise HTTPException(status_code=503, detail="Neo4j driver is not initialized")
+    # Resolved inline rather than via Depends so url_verification works without a database.
+    driver = get_neo4j_driver(request)
+    async with request_session(driver):
+        return await _ingest_message_event(driver, payload)
 
-    should_process, result = preprocess_slack_event(driver=driver, payload=payload)
-    if not should_process:
-        return result
 
-    event = SlackEvent.model_validate(result["event"])
-    parsed = process_slack_event(
-        event,
-        source_message_id=result.get("message_id"),
-        source_permalink=result.get("source_permalink"),
-    )
-    if result.get("structured_attempt") and parsed.parse_error:
-        send_thread_feedback_stub(
-            channel_id=event.channel,
-            thread_ts=event.ts,
-            text="Could not parse update. Please follow the pinned template.",
-        )
-        message_id = result.get("message_id")
-        if message_id:
-            update_slack_message_status(
-                driver,
-                message_id=message_id,
-                ingestion_status="ignored",
-                error_reason="invalid_format",
-            )
-        return {
-            **result,
-            "status": "ignored",
-            "reason": "invalid_format",
-            "parsed": parsed.model_dump(),
-        }
+async def _ingest_message_event(driver: AsyncDriver, payload: dict) -> dict:
+    parsed, event, result = await preprocess_slack_event(driver=driver, payload=payload)
+    if parsed is None:
+        return result
 
     if parsed.proposed_diff is not None:
-        unknown_project_ids = find_unknown_project_ids(parsed.proposed_diff)
-        if unknown_project_ids:
-            valid_projects = ", ".join(get_configured_project_ids())
-            send_thread_feedback_stub(
-                channel_id=event.channel,
-                thread_ts=event.ts,
-                text=f"Unknown project_id. Valid projects: {valid_projects}.",
+        async with commit_apply_lock(parsed.proposed_diff):
+            no_op_reason, commit = await create_graph_commit(
+                driver, parsed.proposed_diff, source="slack"
             )
+        if no_op_reason is not None:
             message_id = result.get("message_id")
             if message_id:
-                update_slack_message_status(
-                    driver,
-                    message_id=message_id,
-                    ingestion_status="invalid_unknown_project",
-                    error_reason=f"unknown_project_id:{','.join(unknown_project_ids)}",
-                )
-            return {
-                **result,
-                "status": "invalid_unknown_project",
-                "reason": "unknown_project_id",
-                "unknown_project_ids": unknown_project_ids,
-                "parsed": parsed.model_dump(),
-            }
-
-        message_id = result.get("message_id")
-        if is_constraint_no_op(driver, parsed.proposed_diff):
-            if message_id:
-                update_slack_message_status(
-                    driver,
-                    message_id=message_id,
-                    ingestion_status="no_op_duplicate",
-                    error_reason="constraint_no_op_duplicate",
-                )
-            return {
-                **result,
-                "status": "no_op_duplicate",
-                "reason": "constraint_no_op_duplicate",
-                "parsed": parsed.model_dump(),
-            }
-
-        if is_dependency_no_op(driver, parsed.proposed_diff):
-            if message_id:
-                update_slack_message_status(
+                await update_slack_message_status(
                     driver,
                     message_id=message_id,
                     ingestion_status="no_op_duplicate",
-                    error_reason="dependency_no_op_duplicate",
+                    error_reason=no_op_reason,
                 )
-            return {
-                **result,
-                "status": "no_op_duplicate",
-                "reason": "dependency_no_op_duplicate",
-                "parsed": parsed.model_dump(),
-            }
-
-        async with COMMIT_APPLY_LOCK:
-            commit = create_graph_commit(driver, parsed.proposed_diff, source="slack")
-        conflicts = detect_conflicts_after_commit(driver, parsed.proposed_diff, commit)
+            result.update(
+                status="no_op_duplicate",
+                reason=no_op_reason,
+                parsed=parsed.model_dump(),
+            )
+            return result
+
+        conflicts = await detect_conflicts_after_commit(driver, parsed.proposed_diff, commit)
         conflict_report_ids: list[str] = []
         if conflicts:
-            conflict_report_ids = persist_conflict_reports(
+            conflict_report_ids = await persist_conflict_reports(
                 driver, commit_id=commit["commit_id"], conflicts=conflicts
             )
             notification_payload = build_conflict_notification_payload(
@@ -203,12 +150,13 @@ async def ingest_slack_event(request: Request) -> dict:
                 ),
             )
 
-        return {
-            **result,
-            "parsed": parsed.model_dump(),
-            "commit": commit,
-            "conflicts": conflicts,
-            "conflict_report_ids": conflict_report_ids,
-        }
+        result.update(
+            parsed=parsed.model_dump(),
+            commit=commit,
+            conflicts=conflicts,
+            conflict_report_ids=conflict_report_ids,
+        )
+        return result
 
-    return {**result, "parsed": parsed.model_dump()}
+    result["parsed"] = parsed.model_dump()
+    return result
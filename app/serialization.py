@@ -0,0 +1,26 @@
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_sorted(value: object) -> str:
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_SORT_KEYS).decode("utf-8")
+    # Match orjson's compact output so stored JSON does not depend on which encoder ran.
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def dumps_line(value: object) -> bytes:
+    # One newline-terminated JSON document, for NDJSON streams.
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(value, separators=(",", ":"), ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def loads(raw: bytes) -> object:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
@@ -1,22 +1,105 @@
 import asyncio
-import json
+import importlib.util
 import logging
+import time
 import uuid
-from datetime import datetime, timezone
-from urllib.error import URLError
-from urllib.parse import urlencode
-from urllib.request import Request, urlopen
-
-from neo4j import Driver
-from neo4j import ManagedTransaction
+import weakref
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from contextvars import ContextVar
+from datetime import datetime
+
+import httpx
+from neo4j import (
+    READ_ACCESS,
+    WRITE_ACCESS,
+    AsyncDriver,
+    AsyncManagedTransaction,
+    AsyncResult,
+    AsyncSession,
+    RoutingControl,
+)
 from pydantic import ValidationError
 
-from app.config import get_settings, load_projects_config
+from app.config import cached_from_projects_config, get_settings, load_projects_config
 from app.models import BootstrapResponse, ParsedMessage, ProposedGraphDiff, SlackEvent
+from app.neo4j_client import get_database_name
 from app.parser import parse_constraint_update, parse_dependency_update, parse_event
+from app.queries import (
+    ACTIVE_CONSTRAINTS_QUERY,
+    ACTIVE_DEPENDENCIES_QUERY,
+    ADVANCE_GRAPH_HEAD_QUERY,
+    BOOTSTRAP_OWNER_LINKS_QUERY,
+    BOOTSTRAP_PROJECTS_QUERY,
+    COMMIT_CONSTRAINT_UPSERT_QUERY,
+    COMMIT_DEPENDENCY_ADD_QUERY,
+    GRAPH_CHANGES_SINCE_QUERY,
+    LOCK_GRAPH_HEAD_QUERY,
+    NO_OP_CHECK_QUERY,
+    PERSIST_SLACK_MESSAGE_QUERY,
+    PROJECT_ACTIVE_CONSTRAINTS_QUERY,
+    PROJECT_ACTIVE_DEPENDENCIES_QUERY,
+    PROJECT_BY_ID_QUERY,
+    PROJECT_EXISTS_QUERY,
+    UPDATE_SLACK_MESSAGE_STATUS_QUERY,
+)
+from app.serialization import dumps_sorted, loads
 
 logger = logging.getLogger(__name__)
-COMMIT_APPLY_LOCK = asyncio.Lock()
+# project_id -> lock held while a commit touching that project is applied; entries vanish
+# once no commit holds or waits on them.
+_project_commit_locks: weakref.WeakValueDictionary[str, asyncio.Lock] = weakref.WeakValueDictionary()
+
+
+# Set for the duration of request_session(); lets every helper in one request share one
+# session object, and so its causal bookmarks, instead of opening one per query. Each
+# transaction still borrows a connection from the pool and returns it afterwards.
+_request_session: ContextVar[AsyncSession | None] = ContextVar("request_session", default=None)
+
+
+def _open_session(driver: AsyncDriver, access_mode: str) -> AsyncSession:
+    return driver.session(
+        database=get_database_name(),
+        default_access_mode=access_mode,
+        bookmark_manager=driver.execute_query_bookmark_manager,
+    )
+
+
+@asynccontextmanager
+async def request_session(driver: AsyncDriver) -> AsyncIterator[AsyncSession]:
+    # Write access: requests bound this way interleave reads with their own writes.
+    async with _open_session(driver, WRITE_ACCESS) as session:
+        token = _request_session.set(session)
+        try:
+            yield session
+        finally:
+            _request_session.reset(token)
+
+
+@asynccontextmanager
+async def _session(driver: AsyncDriver, access_mode: str) -> AsyncIterator[AsyncSession]:
+    bound_session = _request_session.get()
+    if bound_session is not None:
+        yield bound_session
+        return
+    async with _open_session(driver, access_mode) as session:
+        yield session
+
+
+def _read_session(driver: AsyncDriver) -> AbstractAsyncContextManager[AsyncSession]:
+    return _session(driver, READ_ACCESS)
+
+
+def _write_session(driver: AsyncDriver) -> AbstractAsyncContextManager[AsyncSession]:
+    return _session(driver, WRITE_ACCESS)
+
+
+async def _records_as_dicts(result: AsyncResult) -> list[dict]:
+    # Record is a tuple, so zipping with the keys skips Record.data()'s recursive export of
+    # graph types. Only valid for queries that return scalars, lists and maps, not nodes.
+    keys = result.keys()
+    return [dict(zip(keys, record)) async for record in result]
 
 
 def process_slack_event(
@@ -25,14 +108,31 @@ def process_slack_event(
     source_message_id: str | None = None,
     source_permalink: str | None = None,
 ) -> ParsedMessage:
+    return _process_slack_event(
+        event,
+        _structured_attempt_text(event.text),
+        source_message_id=source_message_id,
+        source_permalink=source_permalink,
+    )
+
+
+def _process_slack_event(
+    event: SlackEvent,
+    normalized_text: str | None,
+    *,
+    source_message_id: str | None,
+    source_permalink: str | None,
+) -> ParsedMessage:
+    # normalized_text is _structured_attempt_text(event.text), passed in so callers that
+    # already computed it do not lower-case the message a second time.
     parsed = parse_event(event)
-    if not is_structured_attempt(event.text):
+    if normalized_text is None:
         return parsed
 
     message_id = source_message_id or f"{event.channel}:{event.ts}"
     permalink = source_permalink or _fallback_permalink(event.channel, event.ts)
     try:
-        if "depends_on:" in event.text.lower():
+        if "depends_on:" in normalized_text:
             proposed_diff = parse_dependency_update(
                 raw_text=event.text,
                 actor_user_id=event.user,
@@ -54,14 +154,24 @@ def process_slack_event(
     return parsed
 
 
+def _structured_attempt_text(raw_text: str) -> str | None:
+    # Returns the lower-cased text when it carries the template markers. Every marker ends
+    # in ':', so ordinary chatter without one is rejected before the lower-cased copy.
+    if ":" not in raw_text:
+        return None
+    normalized_text = raw_text.lower()
+    has_project = "project:" in normalized_text
+    has_mutation = "constraint:" in normalized_text or "depends_on:" in normalized_text
+    return normalized_text if has_project and has_mutation else None
+
+
 def is_structured_attempt(raw_text: str) -> bool:
-    normalized = raw_text.lower()
-    has_project = "project:" in normalized
-    has_mutation = "constraint:" in normalized or "depends_on:" in normalized
-    return has_project and has_mutation
+    return _structured_attempt_text(raw_text) is not None
 
 
 def send_thread_feedback_stub(channel_id: str, thread_ts: str, text: str) -> None:
+    if not logger.isEnabledFor(logging.INFO):
+        return
     logger.info(
         "thread_feedback_stub channel_id=%s thread_ts=%s text=%s",
         channel_id,
@@ -88,241 +198,179 @@ def _build_commit_message(proposed_diff: ProposedGraphDiff) -> str:
     return f"{proposed_diff.update_type} why={proposed_diff.reason}"
 
 
-def _create_graph_commit_tx(
-    tx: ManagedTransaction,
-    *,
-    commit_id: str,
-    actor_user_id: str,
+async def _find_no_op_reason_tx(
+    tx: AsyncManagedTransaction, proposed_diff: ProposedGraphDiff
+) -> str | None:
+    constraint = proposed_diff.constraint
+    dependency = proposed_diff.dependency
+    if constraint is None and dependency is None:
+        return None
+    # Absent halves are passed as nulls, which never match a stored property.
+    result = await tx.run(
+        NO_OP_CHECK_QUERY,
+        project_id=constraint and constraint.project_id,
+        constraint_key=constraint and constraint.constraint_key,
+        constraint_value=constraint and constraint.constraint_value,
+        from_project_id=dependency and dependency.from_project_id,
+        to_project_id=dependency and dependency.to_project_id,
+    )
+    record = await result.single()
+    if record["constraint_no_op"]:
+        return "constraint_no_op_duplicate"
+    if record["dependency_no_op"]:
+        return "dependency_no_op_duplicate"
+    return None
+
+
+async def _lock_graph_head_tx(tx: AsyncManagedTransaction) -> None:
+    # Held until the transaction ends; commits from every worker and process queue here.
+    result = await tx.run(LOCK_GRAPH_HEAD_QUERY)
+    await result.consume()
+
+
+async def _advance_graph_head_tx(tx: AsyncManagedTransaction, commit_id: str) -> dict:
+    head_result = await tx.run(ADVANCE_GRAPH_HEAD_QUERY, commit_id=commit_id)
+    head = await head_result.single()
+    if head is None:
+        raise ValueError("GraphCommit failed: graph head not found; run schema migrations")
+    return {
+        "sequence_number": head["sequence_number"],
+        "parent_commit_id": head["parent_commit_id"],
+    }
+
+
+def _graph_commit_result(
+    commit: dict,
+    head: dict,
     timestamp: str,
-    source: str,
-    diff_json: str,
-    why: str,
-    commit_message: str,
-    proposed_diff_data: dict,
+    *,
+    mutated_project_ids: list[str],
+    prior_active_constraints: list[dict],
 ) -> dict:
-    latest = tx.run(
-        """
-        MATCH (gc:GraphCommit)
-        RETURN gc.commit_id AS commit_id, gc.sequence_number AS sequence_number
-        ORDER BY gc.sequence_number DESC
-        LIMIT 1
-        """
-    ).single()
-
-    if latest is None:
-        sequence_number = 1
-        parent_commit_id = None
-    else:
-        sequence_number = int(latest["sequence_number"]) + 1
-        parent_commit_id = latest["commit_id"]
-
-    tx.run(
-        """
-        CREATE (gc:GraphCommit {
-            commit_id: $commit_id,
-            sequence_number: $sequence_number,
-            parent_commit_id: $parent_commit_id,
-            actor_user_id: $actor_user_id,
-            timestamp: $timestamp,
-            source: $source,
-            diff_json: $diff_json,
-            why: $why,
-            commit_message: $commit_message
-        })
-        """,
-        commit_id=commit_id,
-        sequence_number=sequence_number,
-        parent_commit_id=parent_commit_id,
-        actor_user_id=actor_user_id,
-        timestamp=timestamp,
-        source=source,
-        diff_json=diff_json,
-        why=why,
-        commit_message=commit_message,
-    ).consume()
-
-    tx.run(
-        """
-        MATCH (gc:GraphCommit {commit_id: $commit_id})
-        OPTIONAL MATCH (m:SlackMessage {message_id: $source_message_id})
-        FOREACH (_ IN CASE WHEN m IS NULL THEN [] ELSE [1] END |
-            MERGE (gc)-[:FROM_MESSAGE]->(m)
-        )
-        """,
-        commit_id=commit_id,
-        source_message_id=proposed_diff_data["source_message_id"],
-    ).consume()
-
-    prior_active_constraint_values: list[str] = []
-    mutated_project_ids: list[str] = []
-    if proposed_diff_data["update_type"] == "ConstraintUpsert":
-        constraint = proposed_diff_data["constraint"]
-        result = tx.run(
-            """
-            MATCH (p:Project {project_id: $project_id})
-            OPTIONAL MATCH (p)-[:HAS_CONSTRAINT]->(prior:Constraint {
-                key: $constraint_key,
-                is_active: true
-            })
-            WITH p, collect(prior) AS prior_constraints
-            WITH p,
-                 [c IN prior_constraints WHERE c IS NOT NULL | {
-                     value: c.value,
-                     author_user_id: c.author_user_id
-                 }] AS prior_constraints_data,
-                 prior_constraints
-            FOREACH (c IN prior_constraints |
-                SET c.is_active = false, c.deactivated_at = $timestamp
-            )
-            CREATE (new_constraint:Constraint {
-                constraint_id: $constraint_id,
-                project_id: $project_id,
-                key: $constraint_key,
-                value: $constraint_value,
-                type: $constraint_type,
-                reason: $constraint_reason,
-                is_active: true,
-                source_message_id: $source_message_id,
-                source_permalink: $source_permalink,
-                author_user_id: $actor_user_id,
-                created_at: $timestamp
-            })
-            CREATE (p)-[:HAS_CONSTRAINT]->(new_constraint)
-            WITH p, new_constraint, prior_constraints_data
-            MATCH (gc:GraphCommit {commit_id: $commit_id})
-            CREATE (new_constraint)-[:INTRODUCED_BY]->(gc)
-            MERGE (gc)-[:APPLIES_TO]->(p)
-            SET p.updated_at = $timestamp
-            RETURN p.project_id AS project_id, prior_constraints_data AS prior_constraints_data
-            """,
-            commit_id=commit_id,
-            constraint_id=str(uuid.uuid4()),
-            project_id=constraint["project_id"],
-            constraint_key=constraint["constraint_key"],
-            constraint_value=constraint["constraint_value"],
-            constraint_type=constraint["constraint_type"],
-            constraint_reason=constraint["reason"],
-            source_message_id=proposed_diff_data["source_message_id"],
-            source_permalink=proposed_diff_data["source_permalink"],
-            actor_user_id=actor_user_id,
-            timestamp=timestamp,
-        ).single()
-        if result is None:
-            raise ValueError("ConstraintUpsert failed: target project not found")
-        prior_constraints_data = result["prior_constraints_data"] or []
-        prior_active_constraint_values = [entry["value"] for entry in prior_constraints_data]
-        mutated_project_ids = [result["project_id"]]
-
-    if proposed_diff_data["update_type"] == "DependencyAdd":
-        dependency = proposed_diff_data["dependency"]
-        result = tx.run(
-            """
-            MATCH (from_p:Project {project_id: $from_project_id})
-            MATCH (to_p:Project {project_id: $to_project_id})
-            CREATE (from_p)-[:DEPENDS_ON {
-                dependency_id: $dependency_id,
-                reason: $dependency_reason,
-                is_active: true,
-                source_message_id: $source_message_id,
-                source_permalink: $source_permalink,
-                author_user_id: $actor_user_id,
-                created_at: $timestamp
-            }]->(to_p)
-            WITH from_p, to_p
-            MATCH (gc:GraphCommit {commit_id: $commit_id})
-            MERGE (gc)-[:APPLIES_TO]->(from_p)
-            MERGE (gc)-[:APPLIES_TO]->(to_p)
-            SET from_p.updated_at = $timestamp,
-                to_p.updated_at = $timestamp
-            RETURN from_p.project_id AS from_project_id, to_p.project_id AS to_project_id
-            """,
-            commit_id=commit_id,
-            dependency_id=str(uuid.uuid4()),
-            from_project_id=dependency["from_project_id"],
-            to_project_id=dependency["to_project_id"],
-            dependency_reason=dependency["reason"],
-            source_message_id=proposed_diff_data["source_message_id"],
-            source_permalink=proposed_diff_data["source_permalink"],
-            actor_user_id=actor_user_id,
-            timestamp=timestamp,
-        ).single()
-        if result is None:
-            raise ValueError("DependencyAdd failed: project nodes not found")
-        mutated_project_ids = [result["from_project_id"], result["to_project_id"]]
-
     return {
-        "commit_id": commit_id,
-        "sequence_number": sequence_number,
-        "parent_commit_id": parent_commit_id,
-        "actor_user_id": actor_user_id,
+        "commit_id": commit["commit_id"],
+        "sequence_number": head["sequence_number"],
+        "parent_commit_id": head["parent_commit_id"],
+        "actor_user_id": commit["actor_user_id"],
         "timestamp": timestamp,
-        "source": source,
-        "diff_json": diff_json,
-        "why": why,
-        "commit_message": commit_message,
+        "source": commit["source"],
+        "diff_json": commit["diff_json"],
+        "why": commit["why"],
+        "commit_message": commit["commit_message"],
         "mutated_project_ids": mutated_project_ids,
-        "prior_active_constraint_values": prior_active_constraint_values,
-        "prior_active_constraints": prior_constraints_data if proposed_diff_data["update_type"] == "ConstraintUpsert" else [],
+        "prior_active_constraint_values": [entry["value"] for entry in prior_active_constraints],
+        "prior_active_constraints": prior_active_constraints,
     }
 
 
-def create_graph_commit(driver: Driver, proposed_diff: ProposedGraphDiff, source: str = "slack") -> dict:
-    commit_id = str(uuid.uuid4())
-    timestamp = datetime.now(timezone.utc).isoformat()
-    diff_json = json.dumps(proposed_diff.model_dump(), sort_keys=True)
-    commit_message = _build_commit_message(proposed_diff)
-
-    settings = get_settings()
-    with driver.session(database=settings.neo4j_database) as session:
-        return session.execute_write(
-            _create_graph_commit_tx,
-            commit_id=commit_id,
-            actor_user_id=proposed_diff.actor_user_id,
-            timestamp=timestamp,
-            source=source,
-            diff_json=diff_json,
-            why=proposed_diff.reason,
-            commit_message=commit_message,
-            proposed_diff_data=proposed_diff.model_dump(),
-        )
+async def _create_constraint_commit_tx(
+    tx: AsyncManagedTransaction, commit: dict, proposed_diff: ProposedGraphDiff
+) -> tuple[str | None, dict | None]:
+    # The head lock is taken before the no-op check, so the check and the commit see the
+    # same graph state even when an identical update is committed concurrently.
+    await _lock_graph_head_tx(tx)
+    no_op_reason = await _find_no_op_reason_tx(tx, proposed_diff)
+    if no_op_reason is not None:
+        return no_op_reason, None
+
+    head = await _advance_graph_head_tx(tx, commit["commit_id"])
+    constraint = proposed_diff.constraint
+    result = await tx.run(
+        COMMIT_CONSTRAINT_UPSERT_QUERY,
+        {**commit, **head},
+        constraint_id=str(uuid.uuid4()),
+        project_id=constraint.project_id,
+        constraint_key=constraint.constraint_key,
+        constraint_value=constraint.constraint_value,
+        constraint_type=constraint.constraint_type,
+        constraint_reason=constraint.reason,
+        source_message_id=proposed_diff.source_message_id,
+        source_permalink=proposed_diff.source_permalink,
+    )
+    record = await result.single()
+    if record is None:
+        raise ValueError("ConstraintUpsert failed: target project not found")
+    return None, _graph_commit_result(
+        commit,
+        head,
+        record["timestamp"],
+        mutated_project_ids=[record["project_id"]],
+        prior_active_constraints=record["prior_constraints_data"] or [],
+    )
 
 
-def get_graph_current_truth(driver: Driver) -> dict:
-    settings = get_settings()
-    with driver.session(database=settings.neo4j_database) as session:
-        constraints_result = session.run(
-            """
-            MATCH (p:Project)-[:HAS_CONSTRAINT]->(c:Constraint {is_active: true})
-            RETURN
-              p.project_id AS project_id,
-              c.constraint_id AS constraint_id,
-              c.key AS constraint_key,
-              c.value AS constraint_value,
-              c.type AS constraint_type,
-              c.reason AS reason,
-              c.source_permalink AS source_permalink,
-              c.author_user_id AS author_user_id,
-              c.created_at AS created_at
-            ORDER BY p.project_id, c.key
-            """
-        )
-        constraints = [record.data() for record in constraints_result]
-
-        dependencies_result = session.run(
-            """
-            MATCH (from_p:Project)-[d:DEPENDS_ON {is_active: true}]->(to_p:Project)
-            RETURN
-              d.dependency_id AS dependency_id,
-              from_p.project_id AS from_project_id,
-              to_p.project_id AS to_project_id,
-              d.reason AS reason,
-              d.source_permalink AS source_permalink,
-              d.author_user_id AS author_user_id,
-              d.created_at AS created_at
-            ORDER BY from_p.project_id, to_p.project_id
-            """
-        )
-        dependencies = [record.data() for record in dependencies_result]
+async def _create_dependency_commit_tx(
+    tx: AsyncManagedTransaction, commit: dict, proposed_diff: ProposedGraphDiff
+) -> tuple[str | None, dict | None]:
+    await _lock_graph_head_tx(tx)
+    no_op_reason = await _find_no_op_reason_tx(tx, proposed_diff)
+    if no_op_reason is not None:
+        return no_op_reason, None
+
+    head = await _advance_graph_head_tx(tx, commit["commit_id"])
+    dependency = proposed_diff.dependency
+    result = await tx.run(
+        COMMIT_DEPENDENCY_ADD_QUERY,
+        {**commit, **head},
+        dependency_id=str(uuid.uuid4()),
+        from_project_id=dependency.from_project_id,
+        to_project_id=dependency.to_project_id,
+        dependency_reason=dependency.reason,
+        source_message_id=proposed_diff.source_message_id,
+        source_permalink=proposed_diff.source_permalink,
+    )
+    record = await result.single()
+    if record is None:
+        raise ValueError("DependencyAdd failed: project nodes not found")
+    return None, _graph_commit_result(
+        commit,
+        head,
+        record["timestamp"],
+        mutated_project_ids=[record["from_project_id"], record["to_project_id"]],
+        prior_active_constraints=[],
+    )
+
+
+_CREATE_COMMIT_TX_BY_UPDATE_TYPE = {
+    "ConstraintUpsert": _create_constraint_commit_tx,
+    "DependencyAdd": _create_dependency_commit_tx,
+}
+
+
+async def create_graph_commit(
+    driver: AsyncDriver, proposed_diff: ProposedGraphDiff, source: str = "slack"
+) -> tuple[str | None, dict | None]:
+    commit = {
+        "commit_id": str(uuid.uuid4()),
+        "actor_user_id": proposed_diff.actor_user_id,
+        "source": source,
+        "diff_json": dumps_sorted(proposed_diff.model_dump()),
+        "why": proposed_diff.reason,
+        "commit_message": _build_commit_message(proposed_diff),
+    }
+    create_commit_tx = _CREATE_COMMIT_TX_BY_UPDATE_TYPE[proposed_diff.update_type]
+
+    async with _write_session(driver) as session:
+        return await session.execute_write(create_commit_tx, commit, proposed_diff)
+
+
+async def _read_records(driver: AsyncDriver, query: str, **parameters) -> list[dict]:
+    # Each call borrows its own pooled connection, so independent reads can run under
+    # asyncio.gather; a single session would serialize them.
+    return await driver.execute_query(
+        query,
+        parameters,
+        database_=get_database_name(),
+        routing_=RoutingControl.READ,
+        result_transformer_=_records_as_dicts,
+    )
+
+
+async def get_graph_current_truth(driver: AsyncDriver) -> dict:
+    constraints, dependencies = await asyncio.gather(
+        _read_records(driver, ACTIVE_CONSTRAINTS_QUERY),
+        _read_records(driver, ACTIVE_DEPENDENCIES_QUERY),
+    )
 
     return {
         "constraints": constraints,
@@ -330,108 +378,71 @@ def get_graph_current_truth(driver: Driver) -> dict:
     }
 
 
-def get_graph_changes_since(driver: Driver, since_iso8601: str) -> dict:
-    settings = get_settings()
-    with driver.session(database=settings.neo4j_database) as session:
-        result = session.run(
-            """
-            MATCH (gc:GraphCommit)
-            WHERE datetime(gc.timestamp) >= datetime($since_iso8601)
-            RETURN
-              gc.commit_id AS commit_id,
-              gc.sequence_number AS sequence_number,
-              gc.parent_commit_id AS parent_commit_id,
-              gc.actor_user_id AS actor_user_id,
-              gc.timestamp AS timestamp,
-              gc.source AS source,
-              gc.diff_json AS diff_json,
-              gc.why AS why,
-              gc.commit_message AS commit_message
-            ORDER BY gc.sequence_number ASC
-            """,
-            since_iso8601=since_iso8601,
+async def _stream_records(
+    session: AsyncSession, query: str, **parameters
+) -> AsyncIterator[dict]:
+    result = await session.run(query, parameters)
+    keys = result.keys()
+    async for record in result:
+        yield dict(zip(keys, record))
+
+
+async def stream_graph_current_truth(driver: AsyncDriver) -> AsyncIterator[dict]:
+    # Rows are pulled from the server in fetch-size batches as the client consumes them,
+    # so memory stays flat however many constraints and dependencies are active.
+    async with _read_session(driver) as session:
+        async for constraint in _stream_records(session, ACTIVE_CONSTRAINTS_QUERY):
+            yield {"kind": "constraint", **constraint}
+        async for dependency in _stream_records(session, ACTIVE_DEPENDENCIES_QUERY):
+            yield {"kind": "dependency", **dependency}
+
+
+async def get_graph_changes_since(driver: AsyncDriver, since: datetime) -> dict:
+    # Commit timestamps are native datetimes; an aware datetime parameter is sent as one,
+    # so the comparison is typed and can use the timestamp index.
+    async with _read_session(driver) as session:
+        result = await session.run(
+            GRAPH_CHANGES_SINCE_QUERY,
+            since=since,
         )
-        commits = [record.data() for record in result]
-
-    return {"since": since_iso8601, "commits": commits}
-
-
-def get_project_by_id(driver: Driver, project_id: str) -> dict | None:
-    settings = get_settings()
-    with driver.session(database=settings.neo4j_database) as session:
-        record = session.run(
-            """
-            MATCH (p:Project {project_id: $project_id})
-            OPTIONAL MATCH (owner:Person)-[:OWNS]->(p)
-            RETURN
-              p.project_id AS project_id,
-              p.name AS name,
-              p.created_at AS created_at,
-              p.updated_at AS updated_at,
-              [user_id IN collect(DISTINCT owner.user_id) WHERE user_id IS NOT NULL] AS owner_user_ids
-            LIMIT 1
-            """,
+        commits = await _records_as_dicts(result)
+
+    return {"since": since.isoformat(), "commits": commits}
+
+
+async def stream_graph_changes_since(driver: AsyncDriver, since: datetime) -> AsyncIterator[dict]:
+    async with _read_session(driver) as session:
+        async for commit in _stream_records(session, GRAPH_CHANGES_SINCE_QUERY, since=since):
+            yield commit
+
+
+async def get_project_by_id(driver: AsyncDriver, project_id: str) -> dict | None:
+    async with _read_session(driver) as session:
+        result = await session.run(
+            PROJECT_BY_ID_QUERY,
             project_id=project_id,
-        ).single()
+        )
+        record = await result.single()
     if record is None:
         return None
     return record.data()
 
 
-def get_project_checklist(driver: Driver, project_id: str) -> dict | None:
-    settings = get_settings()
-    with driver.session(database=settings.neo4j_database) as session:
-        project_exists = session.run(
-            """
-            MATCH (p:Project {project_id: $project_id})
-            RETURN p.project_id AS project_id
-            LIMIT 1
-            """,
-            project_id=project_id,
-        ).single()
-        if project_exists is None:
-            return None
-
-        constraints_result = session.run(
-            """
-            MATCH (p:Project {project_id: $project_id})-[:HAS_CONSTRAINT]->(c:Constraint {is_active: true})
-            RETURN
-              c.constraint_id AS constraint_id,
-              c.key AS constraint_key,
-              c.value AS constraint_value,
-              c.type AS constraint_type,
-              c.reason AS reason,
-              c.source_permalink AS source_permalink,
-              c.author_user_id AS author_user_id,
-              c.created_at AS created_at
-            ORDER BY c.type, c.key
-            """,
-            project_id=project_id,
-        )
-        constraints_by_type: dict[str, list[dict]] = {}
-        for record in constraints_result:
-            item = record.data()
-            constraint_type = item.get("constraint_type") or "Unspecified"
-            constraints_by_type.setdefault(constraint_type, []).append(item)
-
-        dependencies_result = session.run(
-            """
-            MATCH (from_p:Project {project_id: $project_id})
-              -[d:DEPENDS_ON {is_active: true}]->
-              (to_p:Project)
-            RETURN
-              d.dependency_id AS dependency_id,
-              from_p.project_id AS from_project_id,
-              to_p.project_id AS to_project_id,
-              d.reason AS reason,
-              d.source_permalink AS source_permalink,
-              d.author_user_id AS author_user_id,
-              d.created_at AS created_at
-            ORDER BY to_p.project_id
-            """,
-            project_id=project_id,
-        )
-        dependencies = [record.data() for record in dependencies_result]
+async def get_project_checklist(driver: AsyncDriver, project_id: str) -> dict | None:
+    # The existence check runs alongside the two reads; an unknown project costs two
+    # empty queries but a known one waits for the slowest read instead of all three.
+    project_rows, constraint_rows, dependencies = await asyncio.gather(
+        _read_records(driver, PROJECT_EXISTS_QUERY, project_id=project_id),
+        _read_records(driver, PROJECT_ACTIVE_CONSTRAINTS_QUERY, project_id=project_id),
+        _read_records(driver, PROJECT_ACTIVE_DEPENDENCIES_QUERY, project_id=project_id),
+    )
+    if not project_rows:
+        return None
+
+    constraints_by_type: dict[str, list[dict]] = {}
+    for item in constraint_rows:
+        constraint_type = item.get("constraint_type") or "Unspecified"
+        constraints_by_type.setdefault(constraint_type, []).append(item)
 
     return {
         "project_id": project_id,
@@ -441,11 +452,25 @@ def get_project_checklist(driver: Driver, project_id: str) -> dict | None:
 
 
 def get_configured_project_ids() -> list[str]:
-    return [project.project_id for project in load_projects_config().projects]
+    return [project["project_id"] for project in load_projects_config().projects]
 
 
-def find_unknown_project_ids(proposed_diff: ProposedGraphDiff) -> list[str]:
-    configured_ids = set(get_configured_project_ids())
+@cached_from_projects_config
+def get_configured_project_ids_display() -> str:
+    return ", ".join(get_configured_project_ids())
+
+
+@cached_from_projects_config
+def _configured_project_id_set() -> frozenset[str]:
+    return frozenset(get_configured_project_ids())
+
+
+@cached_from_projects_config
+def _configured_channel_id() -> str:
+    return load_projects_config().slack["channel_id"]
+
+
+def _referenced_project_ids(proposed_diff: ProposedGraphDiff) -> list[str]:
     referenced_ids: list[str] = []
 
     if proposed_diff.constraint is not None:
@@ -458,11 +483,36 @@ def find_unknown_project_ids(proposed_diff: ProposedGraphDiff) -> list[str]:
             ]
         )
 
-    unknown_ids: list[str] = []
-    for project_id in referenced_ids:
-        if project_id not in configured_ids and project_id not in unknown_ids:
-            unknown_ids.append(project_id)
-    return unknown_ids
+    return list(dict.fromkeys(referenced_ids))
+
+
+def find_unknown_project_ids(proposed_diff: ProposedGraphDiff) -> list[str]:
+    configured_ids = _configured_project_id_set()
+    return [
+        project_id
+        for project_id in _referenced_project_ids(proposed_diff)
+        if project_id not in configured_ids
+    ]
+
+
+@asynccontextmanager
+async def commit_apply_lock(proposed_diff: ProposedGraphDiff) -> AsyncIterator[None]:
+    # Commits on disjoint projects apply concurrently; the GraphHead write lock still
+    # orders their sequence numbers in the database. Locks are taken in sorted order so
+    # two dependency commits over the same pair cannot deadlock.
+    locks = [
+        _project_commit_locks.setdefault(project_id, asyncio.Lock())
+        for project_id in sorted(_referenced_project_ids(proposed_diff))
+    ]
+    acquired: list[asyncio.Lock] = []
+    try:
+        for lock in locks:
+            await lock.acquire()
+            acquired.append(lock)
+        yield
+    finally:
+        for lock in reversed(acquired):
+            lock.release()
 
 
 def _fallback_permalink(channel_id: str, message_ts: str) -> str:
@@ -471,26 +521,77 @@ def _fallback_permalink(channel_id: str, message_ts: str) -> str:
     return f"https://slack.com/archives/{channel_id}/p{message_ts.replace('.', '')}"
 
 
-def resolve_source_permalink(channel_id: str, message_ts: str) -> str:
-    settings = get_settings()
-    query_params = urlencode({"channel": channel_id, "message_ts": message_ts})
-    request = Request(
-        f"https://slack.com/api/chat.getPermalink?{query_params}",
-        headers={"Authorization": f"Bearer {settings.slack_bot_token}"},
-        method="GET",
-    )
+SLACK_API_BASE_URL = "https://slack.com/api"
+SLACK_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32)
+# Slack retries a webhook that is not acknowledged within 3 seconds, so the permalink lookup
+# gets a fraction of that; on timeout the archive-URL fallback is stored instead.
+PERMALINK_LOOKUP_TIMEOUT_SECONDS = 1.0
+# HTTP/2 multiplexes concurrent lookups over one connection; it needs the h2 package
+# (httpx[http2]), so fall back to pooled HTTP/1.1 when it is not installed.
+SLACK_HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+PERMALINK_CACHE_MAX_SIZE = 4096
+PERMALINK_CACHE_TTL_SECONDS = 3600.0
+
+_slack_http_client: httpx.AsyncClient | None = None
+# (channel_id, message_ts) -> (monotonic expiry, permalink); only successful lookups are
+# cached. Accessed from the event loop only, so no lock is needed.
+_permalink_cache: OrderedDict[tuple[str, str], tuple[float, str]] = OrderedDict()
+
+
+def _get_slack_http_client() -> httpx.AsyncClient:
+    global _slack_http_client
+    if _slack_http_client is None:
+        # The bot token is fixed for the client's lifetime; closing the client picks up a
+        # rotated token on the next lookup.
+        _slack_http_client = httpx.AsyncClient(
+            base_url=SLACK_API_BASE_URL,
+            headers={"Authorization": f"Bearer {get_settings().slack_bot_token}"},
+            timeout=PERMALINK_LOOKUP_TIMEOUT_SECONDS,
+            limits=SLACK_HTTP_LIMITS,
+            http2=SLACK_HTTP2_ENABLED,
+        )
+    return _slack_http_client
+
+
+async def close_slack_http_client() -> None:
+    global _slack_http_client
+    if _slack_http_client is not None:
+        await _slack_http_client.aclose()
+        _slack_http_client = None
+
+
+async def resolve_source_permalink(channel_id: str, message_ts: str) -> str:
+    cache_key = (channel_id, message_ts)
+    cached = _permalink_cache.get(cache_key)
+    if cached is not None:
+        expires_at, cached_permalink = cached
+        if expires_at > time.monotonic():
+            _permalink_cache.move_to_end(cache_key)
+            return cached_permalink
+        del _permalink_cache[cache_key]
+
     try:
-        with urlopen(request, timeout=3) as response:
-            payload = json.loads(response.read().decode("utf-8"))
-        if payload.get("ok") and payload.get("permalink"):
-            return payload["permalink"]
-    except (URLError, TimeoutError, OSError, json.JSONDecodeError):
+        response = await _get_slack_http_client().get(
+            "/chat.getPermalink",
+            params={"channel": channel_id, "message_ts": message_ts},
+        )
+        payload = loads(response.content)
+    except (httpx.HTTPError, ValueError):
+        return _fallback_permalink(channel_id, message_ts)
+    if not (payload.get("ok") and payload.get("permalink")):
         return _fallback_permalink(channel_id, message_ts)
-    return _fallback_permalink(channel_id, message_ts)
 
+    _permalink_cache[cache_key] = (
+        time.monotonic() + PERMALINK_CACHE_TTL_SECONDS,
+        payload["permalink"],
+    )
+    if len(_permalink_cache) > PERMALINK_CACHE_MAX_SIZE:
+        _permalink_cache.popitem(last=False)
+    return payload["permalink"]
 
-def _persist_slack_message(
-    driver: Driver,
+
+async def _persist_slack_message(
+    driver: AsyncDriver,
     *,
     message_id: str,
     event_id: str | None,
@@ -501,123 +602,53 @@ def _persist_slack_message(
     permalink: str,
     ingestion_status: str,
     error_reason: str | None = None,
-) -> None:
-    query = """
-    MERGE (m:SlackMessage {message_id: $message_id})
-      ON CREATE SET m.created_at = datetime().epochMillis
-    SET m.event_id = $event_id,
-        m.timestamp = $ts,
-        m.channel_id = $channel_id,
-        m.user_id = $user_id,
-        m.raw_text = $raw_text,
-        m.permalink = $permalink,
-        m.ingestion_status = $ingestion_status,
-        m.error_reason = $error_reason
-    """
-
-    settings = get_settings()
-    with driver.session(database=settings.neo4j_database) as session:
-        session.run(
-            query,
-            message_id=message_id,
-            event_id=event_id,
-            ts=ts,
-            channel_id=channel_id,
-            user_id=user_id,
-            raw_text=raw_text,
-            permalink=permalink,
-            ingestion_status=ingestion_status,
-            error_reason=error_reason,
-        ).consume()
+) -> bool:
+    parameters = {
+        "message_id": message_id,
+        "event_id": event_id,
+        "ts": ts,
+        "channel_id": channel_id,
+        "user_id": user_id,
+        "raw_text": raw_text,
+        "permalink": permalink,
+        "ingestion_status": ingestion_status,
+        "error_reason": error_reason,
+    }
+    # Deliberately a single auto-commit write, never retried by the driver: a retry after a
+    # lost commit ack would see this attempt's own status and report the first delivery
+    # as already processed.
+    async with _write_session(driver) as session:
+        result = await session.run(PERSIST_SLACK_MESSAGE_QUERY, parameters)
+        record = await result.single()
+    return record["already_processed"]
 
 
-def update_slack_message_status(
-    driver: Driver,
+async def update_slack_message_status(
+    driver: AsyncDriver,
     *,
     message_id: str,
     ingestion_status: str,
     error_reason: str | None = None,
 ) -> None:
-    query = """
-    MATCH (m:SlackMessage {message_id: $message_id})
-    SET m.ingestion_status = $ingestion_status,
-        m.error_reason = $error_reason
-    """
-    settings = get_settings()
-    with driver.session(database=settings.neo4j_database) as session:
-        session.run(
-            query,
+    async with _write_session(driver) as session:
+        result = await session.run(
+            UPDATE_SLACK_MESSAGE_STATUS_QUERY,
             message_id=message_id,
             ingestion_status=ingestion_status,
             error_reason=error_reason,
-        ).consume()
-
-
-def get_slack_message_status(driver: Driver, *, message_id: str) -> str | None:
-    query = """
-    MATCH (m:SlackMessage {message_id: $message_id})
-    RETURN m.ingestion_status AS ingestion_status
-    LIMIT 1
-    """
-    settings = get_settings()
-    with driver.session(database=settings.neo4j_database) as session:
-        record = session.run(query, message_id=message_id).single()
-    if record is None:
-        return None
-    return record.get("ingestion_status")
-
-
-def is_constraint_no_op(driver: Driver, proposed_diff: ProposedGraphDiff) -> bool:
-    if proposed_diff.constraint is None:
-        return False
-    query = """
-    MATCH (c:Constraint {
-      project_id: $project_id,
-      key: $constraint_key,
-      value: $constraint_value,
-      is_active: true
-    })
-    RETURN c
-    LIMIT 1
-    """
-    settings = get_settings()
-    with driver.session(database=settings.neo4j_database) as session:
-        record = session.run(
-            query,
-            project_id=proposed_diff.constraint.project_id,
-            constraint_key=proposed_diff.constraint.constraint_key,
-            constraint_value=proposed_diff.constraint.constraint_value,
-        ).single()
-    return record is not None
-
-
-def is_dependency_no_op(driver: Driver, proposed_diff: ProposedGraphDiff) -> bool:
-    if proposed_diff.dependency is None:
-        return False
-    query = """
-    MATCH (:Project {project_id: $from_project_id})
-      -[d:DEPENDS_ON {is_active: true}]->
-      (:Project {project_id: $to_project_id})
-    RETURN d
-    LIMIT 1
-    """
-    settings = get_settings()
-    with driver.session(database=settings.neo4j_database) as session:
-        record = session.run(
-            query,
-            from_project_id=proposed_diff.dependency.from_project_id,
-            to_project_id=proposed_diff.dependency.to_project_id,
-        ).single()
-    return record is not None
-
-
-def preprocess_slack_event(driver: Driver, payload: dict) -> tuple[bool, dict]:
+        )
+        await result.consume()
+
+
+async def preprocess_slack_event(
+    driver: AsyncDriver, payload: dict
+) -> tuple[ParsedMessage | None, SlackEvent | None, dict]:
+    # Returns the parsed message, with the validated event it came from, only when it still
+    # needs a graph commit; every other outcome is final and already recorded on the
+    # SlackMessage.
     event_payload = payload.get("event", {})
     if event_payload.get("type") != "message":
-        return False, {"ok": True, "status": "ignored", "reason": "unsupported_event_type"}
-
-    projects_config = load_projects_config()
-    configured_channel_id = projects_config.slack.channel_id
+        return None, None, {"ok": True, "status": "ignored", "reason": "unsupported_event_type"}
 
     event_id = payload.get("event_id")
     channel_id = event_payload.get("channel", "")
@@ -627,70 +658,41 @@ def preprocess_slack_event(driver: Driver, payload: dict) -> tuple[bool, dict]:
     subtype = event_payload.get("subtype")
     bot_id = event_payload.get("bot_id")
     message_id = event_id or f"{channel_id}:{ts}"
-    structured_attempt = is_structured_attempt(raw_text)
-    existing_status = get_slack_message_status(driver, message_id=message_id)
-    if existing_status in {"processed", "no_op_duplicate"}:
-        update_slack_message_status(
-            driver,
-            message_id=message_id,
-            ingestion_status="no_op_duplicate",
-            error_reason="message_already_processed",
-        )
-        return False, {
-            "ok": True,
-            "status": "no_op_duplicate",
-            "reason": "message_already_processed",
-        }
-
+    normalized_text = _structured_attempt_text(raw_text)
+    structured_attempt = normalized_text is not None
+    event: SlackEvent | None = None
+    parsed: ParsedMessage | None = None
+    unknown_project_ids: list[str] = []
+    permalink = ""
     if bot_id or subtype is not None:
-        _persist_slack_message(
-            driver,
-            message_id=message_id,
-            event_id=event_id,
-            ts=ts,
-            channel_id=channel_id,
-            user_id=user_id,
-            raw_text=raw_text,
-            permalink="",
-            ingestion_status="ignored",
-            error_reason="bot_or_subtype_message",
-        )
-        return False, {"ok": True, "status": "ignored", "reason": "bot_or_subtype_message"}
-
-    if channel_id != configured_channel_id:
-        _persist_slack_message(
-            driver,
-            message_id=message_id,
-            event_id=event_id,
-            ts=ts,
-            channel_id=channel_id,
-            user_id=user_id,
-            raw_text=raw_text,
-            permalink="",
-            ingestion_status="ignored",
-            error_reason="unexpected_channel",
-        )
-        return False, {"ok": True, "status": "ignored", "reason": "unexpected_channel"}
-
-    permalink = resolve_source_permalink(channel_id=channel_id, message_ts=ts)
-    try:
-        event = SlackEvent.model_validate(event_payload)
-    except ValidationError as exc:
-        _persist_slack_message(
-            driver,
-            message_id=message_id,
-            event_id=event_id,
-            ts=ts,
-            channel_id=channel_id,
-            user_id=user_id,
-            raw_text=raw_text,
-            permalink=permalink,
-            ingestion_status="error",
-            error_reason=f"invalid_event_payload: {exc}",
-        )
-        return False, {"ok": False, "status": "error", "reason": "invalid_event_payload"}
-
-    _persist_slack_message(
+        ingestion_status, error_reason = "ignored", "bot_or_subtype_message"
+        response = {"ok": True, "status": "ignored", "reason": "bot_or_subtype_message"}
+    elif channel_id != _configured_channel_id():
+        ingestion_status, error_reason = "ignored", "unexpected_channel"
+        response = {"ok": True, "status": "ignored", "reason": "unexpected_channel"}
+    else:
+        permalink = await resolve_source_permalink(channel_id=channel_id, message_ts=ts)
+        try:
+            event = SlackEvent.model_validate(event_payload)
+        except ValidationError as exc:
+            ingestion_status, error_reason = "error", f"invalid_event_payload: {exc}"
+            response = {"ok": False, "status": "error", "reason": "invalid_event_payload"}
+        else:
+            ingestion_status, error_reason = "processed", None
+            # Outcomes decided by parsing alone go into the same write as the message.
+            parsed = _process_slack_event(
+                event, normalized_text, source_message_id=message_id, source_permalink=permalink
+            )
+            if structured_attempt and parsed.parse_error:
+                ingestion_status, error_reason = "ignored", "invalid_format"
+            elif parsed.proposed_diff is not None:
+                unknown_project_ids = find_unknown_project_ids(parsed.proposed_diff)
+                if unknown_project_ids:
+                    ingestion_status = "invalid_unknown_project"
+                    error_reason = f"unknown_project_id:{','.join(unknown_project_ids)}"
+
+    # One write both records the message and detects a redelivery of a processed one.
+    already_processed = await _persist_slack_message(
         driver,
         message_id=message_id,
         event_id=event_id,
@@ -699,9 +701,19 @@ def preprocess_slack_event(driver: Driver, payload: dict) -> tuple[bool, dict]:
         user_id=user_id,
         raw_text=raw_text,
         permalink=permalink,
-        ingestion_status="processed",
+        ingestion_status=ingestion_status,
+        error_reason=error_reason,
     )
-    return True, {
+    if already_processed:
+        return None, None, {
+            "ok": True,
+            "status": "no_op_duplicate",
+            "reason": "message_already_processed",
+        }
+    if event is None:
+        return None, None, response
+
+    result = {
         "ok": True,
         "status": "processed",
         "message_id": message_id,
@@ -709,35 +721,55 @@ def preprocess_slack_event(driver: Driver, payload: dict) -> tuple[bool, dict]:
         "source_permalink": permalink,
         "structured_attempt": structured_attempt,
     }
+    if error_reason == "invalid_format":
+        send_thread_feedback_stub(
+            channel_id=event.channel,
+            thread_ts=event.ts,
+            text="Could not parse update. Please follow the pinned template.",
+        )
+        result.update(status="ignored", reason="invalid_format", parsed=parsed.model_dump())
+        return None, None, result
+    if unknown_project_ids:
+        send_thread_feedback_stub(
+            channel_id=event.channel,
+            thread_ts=event.ts,
+            text=f"Unknown project_id. Valid projects: {get_configured_project_ids_display()}.",
+        )
+        result.update(
+            status="invalid_unknown_project",
+            reason="unknown_project_id",
+            unknown_project_ids=unknown_project_ids,
+            parsed=parsed.model_dump(),
+        )
+        return None, None, result
+    return parsed, event, result
+
 
+BOOTSTRAP_BATCH_SIZE = 1000
 
-def bootstrap_from_config(driver: Driver) -> BootstrapResponse:
+
+async def bootstrap_from_config(driver: AsyncDriver) -> BootstrapResponse:
     projects_config = load_projects_config()
     project_payload = [
-        {
-            "project_id": project.project_id,
-            "name": project.name,
-            "owner_user_ids": project.owner_user_ids,
-        }
+        {"project_id": project["project_id"], "name": project["name"]}
         for project in projects_config.projects
     ]
+    owner_links = [
+        {"project_id": project["project_id"], "owner_user_id": owner_user_id}
+        for project in projects_config.projects
+        for owner_user_id in project["owner_user_ids"]
+    ]
 
-    owner_link_count = sum(len(project["owner_user_ids"]) for project in project_payload)
-
-    query = """
-    UNWIND $projects AS project
-    MERGE (p:Project {project_id: project.project_id})
-      ON CREATE SET p.created_at = datetime().epochMillis
-    SET p.name = project.name, p.updated_at = datetime().epochMillis
-    WITH p, project
-    UNWIND project.owner_user_ids AS owner_user_id
-    MERGE (person:Person {user_id: owner_user_id})
-    MERGE (person)-[:OWNS]->(p)
-    """
-
-    settings = get_settings()
-    with driver.session(database=settings.neo4j_database) as session:
-        session.run(query, projects=project_payload).consume()
+    async with _write_session(driver) as session:
+        result = await session.run(
+            BOOTSTRAP_PROJECTS_QUERY, projects=project_payload, batch_size=BOOTSTRAP_BATCH_SIZE
+        )
+        await result.consume()
+        result = await session.run(
+            BOOTSTRAP_OWNER_LINKS_QUERY, owner_links=owner_links, batch_size=BOOTSTRAP_BATCH_SIZE
+        )
+        # Counted by the server: only links whose project matched are reported.
+        owner_link_count = (await result.single())["owner_link_count"]
 
     return BootstrapResponse(
         ok=True,
@@ -46,19 +46,32 @@ def main() -> int:
     status_line("Env", bool(password), "NEO4J_PASSWORD set" if password else "NEO4J_PASSWORD missing")
 
     try:
-        addresses = socket.getaddrinfo(host, port)
-        sample = addresses[0][4]
-        status_line("DNS", True, f"resolved {host} -> {sample}")
+        # TCP only, and the port is numeric, so skip the services lookup.
+        addresses = socket.getaddrinfo(
+            host,
+            port,
+            family=socket.AF_UNSPEC,
+            type=socket.SOCK_STREAM,
+            proto=socket.IPPROTO_TCP,
+            flags=socket.AI_NUMERICSERV,
+        )
+        status_line("DNS", True, f"resolved {host} -> {[address[4][0] for address in addresses]}")
     except Exception as exc:  # noqa: BLE001
         status_line("DNS", False, f"{type(exc).__name__}: {exc}")
         return 2
 
-    try:
-        with socket.create_connection((host, port), timeout=5):
-            pass
-        status_line("TCP", True, f"connected to {host}:{port}")
-    except Exception as exc:  # noqa: BLE001
-        status_line("TCP", False, f"{type(exc).__name__}: {exc}")
+    # Probe every resolved endpoint so a broken IPv4 or IPv6 path shows up on its own.
+    connected = False
+    for family, socktype, proto, _, sockaddr in addresses:
+        try:
+            with socket.socket(family, socktype, proto) as sock:
+                sock.settimeout(5)
+                sock.connect(sockaddr)
+            status_line("TCP", True, f"connected to {sockaddr[0]} port {port}")
+            connected = True
+        except Exception as exc:  # noqa: BLE001
+            status_line("TCP", False, f"{sockaddr[0]} port {port}: {type(exc).__name__}: {exc}")
+    if not connected:
         return 3
 
     driver = GraphDatabase.driver(uri, auth=(user, password))
@@ -0,0 +1,43 @@
+from collections.abc import AsyncIterator
+
+import pytest
+
+
+class FakeResult:
+    """Duck-typed stand-in for neo4j.AsyncResult.
+
+    Mirrors the parts of the public API the app uses: keys() is synchronous and returns a
+    tuple, while iteration, single() and consume() are awaited, as on the real driver.
+    """
+
+    def __init__(self, fields: list[str], rows: list[list]) -> None:
+        self._keys = tuple(fields)
+        self._rows = [tuple(row) for row in rows]
+
+    def keys(self) -> tuple[str, ...]:
+        return self._keys
+
+    async def __aiter__(self) -> AsyncIterator[tuple]:
+        for row in self._rows:
+            yield row
+
+    async def single(self) -> dict | None:
+        if not self._rows:
+            return None
+        return dict(zip(self._keys, self._rows[0]))
+
+    async def consume(self) -> None:
+        self._rows = []
+
+
+@pytest.fixture(autouse=True)
+def neo4j_env(monkeypatch):
+    for name, value in {
+        "NEO4J_URI": "neo4j://localhost:7687",
+        "NEO4J_USERNAME": "neo4j",
+        "NEO4J_PASSWORD": "password",
+        "NEO4J_DATABASE": "neo4j",
+        "SLACK_BOT_TOKEN": "xoxb-test",
+        "SLACK_SIGNING_SECRET": "secret",
+    }.items():
+        monkeypatch.setenv(name, value)
@@ -0,0 +1,45 @@
+import json
+
+from app.config import clear_config_caches
+from app.conflicts import _project_owner_ids_by_project
+from app.service import (
+    _configured_channel_id,
+    _configured_project_id_set,
+    get_configured_project_ids_display,
+)
+
+
+def _write_projects_config(path, channel_id: str, project_ids: list[str]) -> None:
+    path.write_text(
+        json.dumps(
+            {
+                "slack": {"channel_name": "Projects", "channel_id": channel_id},
+                "projects": [
+                    {"project_id": project_id, "name": project_id, "owner_user_ids": ["U1"]}
+                    for project_id in project_ids
+                ],
+            }
+        ),
+        encoding="utf-8",
+    )
+
+
+def test_clear_config_caches_resets_derived_values(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "config").mkdir()
+    config_path = tmp_path / "config" / "projects.json"
+    clear_config_caches()
+    try:
+        _write_projects_config(config_path, "C1", ["alpha", "beta"])
+        assert _configured_channel_id() == "C1"
+        assert get_configured_project_ids_display() == "alpha, beta"
+
+        _write_projects_config(config_path, "C2", ["gamma", "delta"])
+        clear_config_caches()
+
+        assert _configured_channel_id() == "C2"
+        assert get_configured_project_ids_display() == "gamma, delta"
+        assert _configured_project_id_set() == frozenset({"gamma", "delta"})
+        assert _project_owner_ids_by_project() == {"gamma": ("U1",), "delta": ("U1",)}
+    finally:
+        clear_config_caches()
@@ -0,0 +1,64 @@
+import asyncio
+
+import pytest
+from neo4j.exceptions import Neo4jError
+
+from app.migrations import (
+    DATA_MIGRATION_APPLIED_QUERY,
+    GRAPH_COMMIT_TIMESTAMP_BACKFILL_STATEMENT,
+    RECORD_DATA_MIGRATION_STATEMENT,
+)
+from app.neo4j_client import run_data_migrations
+from tests.conftest import FakeResult
+
+
+class RecordingSession:
+    def __init__(self, applied: bool, fail_on: str | None = None) -> None:
+        self.applied = applied
+        self.fail_on = fail_on
+        self.queries: list[str] = []
+
+    async def __aenter__(self) -> "RecordingSession":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        pass
+
+    async def run(self, query, parameters=None, **kwargs):
+        self.queries.append(query)
+        if query == self.fail_on:
+            raise Neo4jError("boom")
+        if query == DATA_MIGRATION_APPLIED_QUERY:
+            return FakeResult(["applied"], [[self.applied]])
+        return FakeResult([], [])
+
+
+class FakeDriver:
+    def __init__(self, session: RecordingSession) -> None:
+        self._session = session
+
+    def session(self, **kwargs) -> RecordingSession:
+        return self._session
+
+
+def test_data_migration_runs_once_and_is_recorded():
+    session = RecordingSession(applied=False)
+    asyncio.run(run_data_migrations(FakeDriver(session)))
+    assert session.queries == [
+        DATA_MIGRATION_APPLIED_QUERY,
+        GRAPH_COMMIT_TIMESTAMP_BACKFILL_STATEMENT,
+        RECORD_DATA_MIGRATION_STATEMENT,
+    ]
+
+
+def test_data_migration_is_skipped_once_applied():
+    session = RecordingSession(applied=True)
+    asyncio.run(run_data_migrations(FakeDriver(session)))
+    assert session.queries == [DATA_MIGRATION_APPLIED_QUERY]
+
+
+def test_data_migration_failure_aborts_startup_unrecorded():
+    session = RecordingSession(applied=False, fail_on=GRAPH_COMMIT_TIMESTAMP_BACKFILL_STATEMENT)
+    with pytest.raises(Neo4jError):
+        asyncio.run(run_data_migrations(FakeDriver(session)))
+    assert RECORD_DATA_MIGRATION_STATEMENT not in session.queries
@@ -0,0 +1,72 @@
+from fastapi.testclient import TestClient
+from neo4j.exceptions import ServiceUnavailable
+
+from app.main import app
+from app.queries import ACTIVE_CONSTRAINTS_QUERY, ACTIVE_DEPENDENCIES_QUERY
+from app.serialization import loads
+from tests.conftest import FakeResult
+
+QUERY_ROWS = {
+    ACTIVE_CONSTRAINTS_QUERY: (["constraint_id", "value"], [["c-1", "v1"], ["c-2", "v2"]]),
+    ACTIVE_DEPENDENCIES_QUERY: (["dependency_id"], [["d-1"]]),
+}
+
+
+class InterruptedResult(FakeResult):
+    async def __aiter__(self):
+        yield ("d-1",)
+        raise ServiceUnavailable("connection lost")
+
+
+class FakeSession:
+    def __init__(self, results: dict | None = None) -> None:
+        self._results = results or {}
+
+    async def __aenter__(self) -> "FakeSession":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        pass
+
+    async def run(self, query, parameters=None, **kwargs):
+        if query in self._results:
+            return self._results[query]
+        return FakeResult(*QUERY_ROWS[query])
+
+
+class FakeDriver:
+    execute_query_bookmark_manager = None
+
+    def __init__(self, results: dict | None = None) -> None:
+        self._results = results
+
+    def session(self, **kwargs) -> FakeSession:
+        return FakeSession(self._results)
+
+
+def test_graph_current_stream_sends_every_row():
+    app.state.neo4j_driver = FakeDriver()
+    try:
+        response = TestClient(app).get("/read/graph/current/stream")
+    finally:
+        del app.state.neo4j_driver
+
+    assert response.status_code == 200
+    assert [loads(line) for line in response.content.splitlines()] == [
+        {"kind": "constraint", "constraint_id": "c-1", "value": "v1"},
+        {"kind": "constraint", "constraint_id": "c-2", "value": "v2"},
+        {"kind": "dependency", "dependency_id": "d-1"},
+    ]
+
+
+def test_graph_current_stream_marks_interrupted_body():
+    interrupted = InterruptedResult(["dependency_id"], [])
+    app.state.neo4j_driver = FakeDriver({ACTIVE_DEPENDENCIES_QUERY: interrupted})
+    try:
+        response = TestClient(app).get("/read/graph/current/stream")
+    finally:
+        del app.state.neo4j_driver
+
+    rows = [loads(line) for line in response.content.splitlines()]
+    assert rows[-2] == {"kind": "dependency", "dependency_id": "d-1"}
+    assert rows[-1] == {"kind": "error", "detail": "stream_interrupted"}
@@ -0,0 +1,61 @@
+import asyncio
+
+from app.models import DependencyDiff, ProposedGraphDiff
+from app.queries import LOCK_GRAPH_HEAD_QUERY, NO_OP_CHECK_QUERY
+from app.service import _create_dependency_commit_tx, _records_as_dicts, _stream_records
+from tests.conftest import FakeResult
+
+
+def test_records_as_dicts_zips_keys_with_rows():
+    async def run() -> list[dict]:
+        result = FakeResult(["constraint_id", "value"], [["c-1", "2026-01-01"], ["c-2", None]])
+        return await _records_as_dicts(result)
+
+    assert asyncio.run(run()) == [
+        {"constraint_id": "c-1", "value": "2026-01-01"},
+        {"constraint_id": "c-2", "value": None},
+    ]
+
+
+class SingleResultSession:
+    def __init__(self, result: FakeResult) -> None:
+        self._result = result
+
+    async def run(self, query, parameters=None, **kwargs) -> FakeResult:
+        return self._result
+
+
+def test_stream_records_yields_each_row_as_dict():
+    async def run() -> list[dict]:
+        session = SingleResultSession(FakeResult(["commit_id"], [["gc-1"], ["gc-2"]]))
+        return [row async for row in _stream_records(session, "RETURN 1")]
+
+    assert asyncio.run(run()) == [{"commit_id": "gc-1"}, {"commit_id": "gc-2"}]
+
+
+class RecordingTransaction:
+    def __init__(self) -> None:
+        self.queries: list[str] = []
+
+    async def run(self, query, parameters=None, **kwargs) -> FakeResult:
+        self.queries.append(query)
+        if query == NO_OP_CHECK_QUERY:
+            return FakeResult(["constraint_no_op", "dependency_no_op"], [[False, True]])
+        return FakeResult([], [])
+
+
+def test_commit_takes_graph_head_lock_before_no_op_check():
+    tx = RecordingTransaction()
+    proposed_diff = ProposedGraphDiff(
+        update_type="DependencyAdd",
+        actor_user_id="U1",
+        source_message_id="m-1",
+        source_permalink="",
+        dependency=DependencyDiff(from_project_id="alpha", to_project_id="beta", reason="r"),
+        reason="r",
+    )
+
+    no_op_reason, commit = asyncio.run(_create_dependency_commit_tx(tx, {}, proposed_diff))
+
+    assert (no_op_reason, commit) == ("dependency_no_op_duplicate", None)
+    assert tx.queries == [LOCK_GRAPH_HEAD_QUERY, NO_OP_CHECK_QUERY]